@@ -9,3 +9,6 @@ class SfdConfig(AppConfig):
         from sfd.common.font import register_japanese_fonts
 
         register_japanese_fonts()
+
+        # Connect the model signal receivers
+        import sfd.signals  # noqa: F401
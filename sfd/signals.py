@@ -0,0 +1,19 @@
+"""Model signal receivers, connected in SfdConfig.ready()."""
+
+from django.conf import settings
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from sfd.models import Holiday
+
+
+@receiver(post_save, sender=Holiday)
+@receiver(post_delete, sender=Holiday)
+def clear_holiday_years_cache(sender, using=None, **kwargs) -> None:
+    """Clear the holiday admin's memoized year choices when a holiday changes."""
+    if not getattr(settings, "SFD_CACHE_HOLIDAY_YEARS", False):
+        return
+
+    from sfd.views.holiday import clear_recent_years_cache
+
+    clear_recent_years_cache(using)
@@ -1,12 +1,56 @@
+import weakref
+from datetime import date, time, timedelta
+from decimal import Decimal
+
 from django import template
+from django.conf import settings
 
 register = template.Library()
 
+# Attribute values memoized per object id when SFD_CACHE_TEMPLATETAG_ATTRS is enabled.
+# A weakref finalizer drops each entry when its object is collected, so a reused id never sees stale values.
+_attr_cache: dict[int, dict[str, object]] = {}
 
-@register.filter
-def get_attr(obj, name):
-    """Template filter to get an attribute of an object dynamically."""
+# Only values of these types are cached: they cannot hold a reference back to the object, which would
+# keep it alive through _attr_cache and stop its finalizer from ever running (e.g. bound methods, managers)
+_CACHEABLE_TYPES = (type(None), bool, int, float, complex, str, bytes, Decimal, date, time, timedelta)
+
+
+def _lookup_attr(obj, name):
     try:
         return getattr(obj, name)
     except (AttributeError, TypeError):
         return None
+
+
+def _get_cached_attr(obj, name):
+    key = id(obj)
+    attrs = _attr_cache.get(key)
+    if attrs is not None and name in attrs:
+        return attrs[name]
+
+    value = _lookup_attr(obj, name)
+    if not isinstance(value, _CACHEABLE_TYPES):
+        return value
+    if attrs is None:
+        try:
+            weakref.finalize(obj, _attr_cache.pop, key, None)
+        except TypeError:
+            # Objects that cannot be weakly referenced (None, int, str, __slots__ classes) are not cached
+            return value
+        attrs = _attr_cache[key] = {}
+    attrs[name] = value
+    return value
+
+
+@register.filter
+def get_attr(obj, name):
+    """Template filter to get an attribute of an object dynamically.
+
+    When ``settings.SFD_CACHE_TEMPLATETAG_ATTRS`` is True, scalar values (strings, numbers,
+    dates, None) are memoized per object for as long as the object is alive. Enable it only for templates rendering read-only
+    objects: attributes changed after the first lookup are not seen.
+    """
+    if getattr(settings, "SFD_CACHE_TEMPLATETAG_ATTRS", False):
+        return _get_cached_attr(obj, name)
+    return _lookup_attr(obj, name)
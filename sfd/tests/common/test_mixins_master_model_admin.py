@@ -218,10 +218,7 @@ class BaseModelAdminMixinTest(BaseTestMixin, TestCase):
             "valid_from": future_date.isoformat(),
             "_delete": "Delete",
         }
-        request = self.factory.post(f"/admin/sfd/testmastermodel/{obj.pk}/change/", data=post_data)
-        request.user = self.user
-        request.session = {}
-        request._messages = FallbackStorage(request)
+        request, _storage = self.create_messaging_request(f"/admin/sfd/testmastermodel/{obj.pk}/change/", post_data)
 
         # Act
         with translation.override("en"):
@@ -255,10 +252,7 @@ class BaseModelAdminMixinTest(BaseTestMixin, TestCase):
             "valid_from": past_date.isoformat(),
             "_delete": "Delete",
         }
-        request = self.factory.post(f"/admin/sfd/testmastermodel/{obj.pk}/change/", data=post_data)
-        request.user = self.user
-        request.session = {}
-        request._messages = FallbackStorage(request)
+        request, _storage = self.create_messaging_request(f"/admin/sfd/testmastermodel/{obj.pk}/change/", post_data)
 
         # Act
         with translation.override("en"):
@@ -298,10 +292,7 @@ class BaseModelAdminMixinTest(BaseTestMixin, TestCase):
             "valid_from": future_date.isoformat(),
             "_delete": "Delete",
         }
-        request = self.factory.post(f"/admin/sfd/testmastermodel/{obj.pk}/change/", data=post_data)
-        request.user = self.user
-        request.session = {}
-        request._messages = FallbackStorage(request)
+        request, _storage = self.create_messaging_request(f"/admin/sfd/testmastermodel/{obj.pk}/change/", post_data)
 
         # Act
         with translation.override("en"):
@@ -337,10 +328,7 @@ class BaseModelAdminMixinTest(BaseTestMixin, TestCase):
             "valid_from": future_date.isoformat(),
             "_delete": "Delete",
         }
-        request = self.factory.post(f"/admin/sfd/testmastermodel/{obj.pk}/change/", data=post_data)
-        request.user = self.user
-        request.session = {}
-        request._messages = FallbackStorage(request)
+        request, _storage = self.create_messaging_request(f"/admin/sfd/testmastermodel/{obj.pk}/change/", post_data)
 
         # Act
         with translation.override("en"):
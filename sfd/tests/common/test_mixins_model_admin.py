@@ -6,7 +6,6 @@ import pytest
 from django import forms
 from django.contrib import admin, messages
 from django.contrib.admin import AdminSite
-from django.contrib.messages.storage.fallback import FallbackStorage
 from django.db import IntegrityError
 from django.template.response import TemplateResponse
 from django.test import TestCase
@@ -505,12 +504,7 @@ class ModelAdminMixinTest(BaseTestMixin, TestCase):
         obj2 = TestModel.objects.create(name="Test 2")
 
         # Prepare request with selected object IDs
-        request = self.factory.post("/admin/", {"_selected_action": [obj1.id, obj2.id]})  # type: ignore[arg-type]
-        request.user = self.user
-
-        request.session = {}  # type: ignore[attr-defined]
-        storage = FallbackStorage(request)
-        request._messages = storage  # type: ignore[attr-defined]
+        request, storage = self.create_messaging_request("/admin/", {"_selected_action": [obj1.id, obj2.id]})
 
         # Mock get_deleted_objects to simulate permission needed
         mock_get_deleted_objects.return_value = ([], {}, {"sdf.TestModel"}, ["TestModel protected"])
@@ -7,16 +7,103 @@ used throughout the SFD application, ensuring proper functionality and
 error handling.
 """
 
+import copy
+import gc
+from time import perf_counter_ns
+
 import pytest
-from django.template import Context, Template
-from django.test import TestCase
+from django.template import Context, Engine
+from django.template.loaders.cached import Loader as CachedLoader
+from django.test import SimpleTestCase, override_settings
 
+from sfd.templatetags import common_filters
 from sfd.templatetags.common_filters import get_attr
 
 
+class SampleObject:
+    """Object with attributes of various types."""
+
+    __slots__ = ("name", "value", "is_active", "nullable_field", "empty_string", "nested", "long_attribute_name")
+
+    def __init__(self):
+        self.name = "Test Name"
+        self.value = 42
+        self.is_active = True
+        self.nullable_field = None
+        self.empty_string = ""
+
+
+class NestedObject:
+    """Object attached to SampleObject for complex attribute testing."""
+
+    __slots__ = ("nested_value",)
+
+    def __init__(self):
+        self.nested_value = "Nested Content"
+
+
+class MockModel:
+    """Django model-like object."""
+
+    __slots__ = ("id", "title", "created_at")
+
+    def __init__(self):
+        self.id = 1
+        self.title = "Test Title"
+        self.created_at = "2025-07-29"
+
+
+class MockObject:
+    """Object exposing a method instead of a plain attribute."""
+
+    __slots__ = ()
+
+    def get_display_name(self):
+        return "Display Name"
+
+
+class NamedObject:
+    """Object holding only a name, used in loop templates."""
+
+    __slots__ = ("name",)
+
+    def __init__(self, name):
+        self.name = name
+
+
+class MultiFieldObject:
+    """Object read by several get_attr calls in one template."""
+
+    __slots__ = ("title", "description", "status")
+
+    def __init__(self):
+        self.title = "Test Title"
+        self.description = "Test Description"
+        self.status = "active"
+
+
+class ValueObject:
+    """Object holding a single value, used by the performance test."""
+
+    __slots__ = ("value",)
+
+    def __init__(self):
+        self.value = "Test Value"
+
+
+class CacheableObject:
+    """Plain object that supports weak references, used by the attribute cache tests."""
+
+    def __init__(self):
+        self.name = "Cached Name"
+
+    def get_name(self):
+        return self.name
+
+
 @pytest.mark.unit
 @pytest.mark.common
-class GetAttrFilterTest(TestCase):
+class GetAttrFilterTest(SimpleTestCase):
     """Test the get_attr template filter functionality.
 
     The get_attr filter allows dynamic attribute access in Django templates,
@@ -37,91 +124,93 @@ class GetAttrFilterTest(TestCase):
         - Complex object attribute access
     """
 
-    def setUp(self):
-        """Set up test fixtures for get_attr filter tests.
+    @classmethod
+    def setUpClass(cls):
+        """Compile the templates and build the fixture objects once per class.
 
-        Creates mock objects with various attribute types and structures
-        to test different scenarios of attribute access.
+        Parsing is the expensive part of ``Template``; rendering a compiled
+        template leaves no state behind on it or on a context whose pushed
+        variables are popped again, so both are safely shared between tests.
         """
-
-        # Create test objects with various attributes using a simple class
-        class TestObject:
-            def __init__(self):
-                self.name = "Test Name"
-                self.value = 42
-                self.is_active = True
-                self.nullable_field = None
-                self.empty_string = ""
-
-        self.test_obj = TestObject()
+        super().setUpClass()
+        # Compile through the shared default engine instead of resolving it in every Template() call
+        engine = Engine.get_default()
+        cls.templates = {
+            "name": engine.from_string("{% load common_filters %}{{ obj|get_attr:'name' }}"),
+            "get_display_name": engine.from_string("{% load common_filters %}{{ obj|get_attr:'get_display_name' }}"),
+            "dynamic": engine.from_string("{% load common_filters %}{{ obj|get_attr:attr_name }}"),
+            "long_attribute_name": engine.from_string("{% load common_filters %}{{ obj|get_attr:'long_attribute_name' }}"),
+            "load": engine.from_string("{% load common_filters %}Template loaded successfully"),
+            "conditional": engine.from_string("{% load common_filters %}{% if obj|get_attr:'is_active' %}Active{% else %}Inactive{% endif %}"),
+            "loop": engine.from_string(
+                """{% load common_filters %}{% for item in objects %}{{ item|get_attr:'name' }}{% if not forloop.last %}, {% endif %}{% endfor %}"""
+            ),
+            "multiple": engine.from_string(
+                "{% load common_filters %}"
+                "Title: {{ obj|get_attr:'title' }}|Description: {{ obj|get_attr:'description' }}|Status: {{ obj|get_attr:'status' }}"
+            ),
+            "performance": engine.from_string("""{% load common_filters %}{% for i in range %}{{ obj|get_attr:'value' }}{% endfor %}"""),
+        }
+
+        # Tests push their variables onto one shared context instead of building a Context per render
+        cls.base_context = Context()
+
+        # Templates for attribute lookups expected to fail, keyed by attribute name
+        cls.none_templates = {
+            name: engine.from_string("{% load common_filters %}{{ obj|get_attr:'" + name + "' }}") for name in ("nonexistent", "name", "")
+        }
+
+        # Fixture objects are only read by the tests, so they are built once per class.
+        # Tests that need to add attributes work on a copy.
+        cls.test_obj = SampleObject()
 
         # Create nested object for complex attribute testing
-        class NestedObject:
-            def __init__(self):
-                self.nested_value = "Nested Content"
+        cls.nested_obj = NestedObject()
+        cls.test_obj.nested = cls.nested_obj
 
-        self.nested_obj = NestedObject()
-        self.test_obj.nested = self.nested_obj
+        # Objects iterated by the loop template
+        cls.loop_objects = [NamedObject(f"Object {i}") for i in range(3)]
 
-    def test_get_attr_success_string_attribute(self):
-        """Test successful retrieval of string attribute.
-
-        Verifies that the get_attr filter correctly retrieves
-        string attributes from objects.
-        """
-        template = Template("{% load common_filters %}{{ obj|get_attr:'name' }}")
-        context = Context({"obj": self.test_obj})
-        result = template.render(context)
-
-        self.assertEqual(result, "Test Name")
-
-    def test_get_attr_success_integer_attribute(self):
-        """Test successful retrieval of integer attribute.
-
-        Verifies that the get_attr filter correctly retrieves
-        numeric attributes from objects.
-        """
-        template = Template("{% load common_filters %}{{ obj|get_attr:'value' }}")
-        context = Context({"obj": self.test_obj})
-        result = template.render(context)
-
-        self.assertEqual(result, "42")
-
-    def test_get_attr_success_boolean_attribute(self):
-        """Test successful retrieval of boolean attribute.
-
-        Verifies that the get_attr filter correctly retrieves
-        boolean attributes from objects.
-        """
-        template = Template("{% load common_filters %}{{ obj|get_attr:'is_active' }}")
-        context = Context({"obj": self.test_obj})
-        result = template.render(context)
+    def _render(self, template, **variables):
+        """Render a compiled template with the variables pushed onto the shared base context."""
+        with self.base_context.push(**variables):
+            return template.render(self.base_context)
 
-        self.assertEqual(result, "True")
+    def _assert_renders_none(self, obj, attr_name):
+        """Assert that get_attr returns None and that the template renders it as "None"."""
+        self.assertIsNone(get_attr(obj, attr_name))
+        self.assertEqual(self._render(self.none_templates[attr_name], obj=obj), "None")
 
-    def test_get_attr_none_attribute(self):
-        """Test retrieval of None attribute value.
+    def test_get_attr_template_integration(self):
+        """Test get_attr end-to-end through the template engine.
 
-        Verifies that the get_attr filter correctly handles
-        attributes that have None values.
+        Verifies that the filter is registered in the common_filters
+        library and renders the attribute value in a template.
         """
-        template = Template("{% load common_filters %}{{ obj|get_attr:'nullable_field' }}")
-        context = Context({"obj": self.test_obj})
-        result = template.render(context)
+        result = self._render(self.templates["name"], obj=self.test_obj)
 
-        self.assertEqual(result, "None")
+        self.assertEqual(result, "Test Name")
 
-    def test_get_attr_empty_string_attribute(self):
-        """Test retrieval of empty string attribute.
+    def test_get_attr_return_values(self):
+        """Test retrieval of attributes of various types.
 
-        Verifies that the get_attr filter correctly handles
-        attributes that have empty string values.
+        Verifies that the get_attr filter returns string, numeric,
+        boolean, None and empty string attribute values unchanged,
+        and None for a missing attribute.
         """
-        template = Template("{% load common_filters %}{{ obj|get_attr:'empty_string' }}")
-        context = Context({"obj": self.test_obj})
-        result = template.render(context)
-
-        self.assertEqual(result, "")
+        cases = [
+            ("name", "Test Name"),
+            ("value", 42),
+            ("is_active", True),
+            ("nullable_field", None),
+            ("empty_string", ""),
+            ("nonexistent", None),
+        ]
+        for attr_name, expected in cases:
+            with self.subTest(attr_name=attr_name):
+                result = get_attr(self.test_obj, attr_name)
+                self.assertIs(type(result), type(expected))
+                self.assertEqual(result, expected)
 
     def test_get_attr_missing_attribute(self):
         """Test handling of missing attribute.
@@ -129,15 +218,7 @@ class GetAttrFilterTest(TestCase):
         Verifies that the get_attr filter returns None (renders as empty)
         when attempting to access a non-existent attribute.
         """
-        # Test direct function call - should return None
-        result = get_attr(self.test_obj, "nonexistent")
-        self.assertIsNone(result)
-
-        # Test template rendering - None should render as "None" string
-        template = Template("{% load common_filters %}{{ obj|get_attr:'nonexistent' }}")
-        context = Context({"obj": self.test_obj})
-        template_result = template.render(context)
-        self.assertEqual(template_result, "None")
+        self._assert_renders_none(self.test_obj, "nonexistent")
 
     def test_get_attr_none_object(self):
         """Test handling of None object.
@@ -145,15 +226,7 @@ class GetAttrFilterTest(TestCase):
         Verifies that the get_attr filter safely handles None objects
         without raising exceptions.
         """
-        # Test direct function call - should return None
-        result = get_attr(None, "name")
-        self.assertIsNone(result)
-
-        # Test template rendering - None should render as "None" string
-        template = Template("{% load common_filters %}{{ obj|get_attr:'name' }}")
-        context = Context({"obj": None})
-        template_result = template.render(context)
-        self.assertEqual(template_result, "None")
+        self._assert_renders_none(None, "name")
 
     def test_get_attr_invalid_object_type(self):
         """Test handling of invalid object types.
@@ -173,21 +246,9 @@ class GetAttrFilterTest(TestCase):
         Verifies that the get_attr filter works correctly with
         Django model instances or similar objects.
         """
-
-        # Create a more realistic Django-like object
-        class MockModel:
-            def __init__(self):
-                self.id = 1
-                self.title = "Test Title"
-                self.created_at = "2025-07-29"
-
         model_obj = MockModel()
 
-        template = Template("{% load common_filters %}{{ obj|get_attr:'title' }}")
-        context = Context({"obj": model_obj})
-        result = template.render(context)
-
-        self.assertEqual(result, "Test Title")
+        self.assertEqual(get_attr(model_obj, "title"), "Test Title")
 
     def test_get_attr_with_method_call(self):
         """Test get_attr with method names (should return method object).
@@ -195,11 +256,6 @@ class GetAttrFilterTest(TestCase):
         Verifies that the get_attr filter returns method objects
         when accessing methods, but doesn't call them.
         """
-
-        class MockObject:
-            def get_display_name(self):
-                return "Display Name"
-
         obj = MockObject()
 
         # Test direct function call - should return the method object
@@ -209,9 +265,8 @@ class GetAttrFilterTest(TestCase):
         self.assertEqual(result(), "Display Name")  # Verify it's the correct method
 
         # Test template rendering - method object should be rendered as string
-        template = Template("{% load common_filters %}{{ obj|get_attr:'get_display_name' }}")
-        context = Context({"obj": obj})
-        template_result = template.render(context)
+        template = self.templates["get_display_name"]
+        template_result = self._render(template, obj=obj)
 
         # Should not be the actual method result
         self.assertNotEqual(template_result, "Display Name")
@@ -224,9 +279,8 @@ class GetAttrFilterTest(TestCase):
         Verifies that the get_attr filter works when the attribute name
         comes from a template variable.
         """
-        template = Template("{% load common_filters %}{{ obj|get_attr:attr_name }}")
-        context = Context({"obj": self.test_obj, "attr_name": "name"})
-        result = template.render(context)
+        template = self.templates["dynamic"]
+        result = self._render(template, obj=self.test_obj, attr_name="name")
 
         self.assertEqual(result, "Test Name")
 
@@ -236,15 +290,7 @@ class GetAttrFilterTest(TestCase):
         Verifies that the get_attr filter safely handles empty
         or None attribute names.
         """
-        # Test direct function call with empty string - should return None
-        result = get_attr(self.test_obj, "")
-        self.assertIsNone(result)
-
-        # Test template rendering - None should render as "None" string
-        template = Template("{% load common_filters %}{{ obj|get_attr:'' }}")
-        context = Context({"obj": self.test_obj})
-        template_result = template.render(context)
-        self.assertEqual(template_result, "None")
+        self._assert_renders_none(self.test_obj, "")
 
     def test_get_attr_none_attribute_name(self):
         """Test get_attr with None attribute name.
@@ -262,12 +308,12 @@ class GetAttrFilterTest(TestCase):
         Verifies that the get_attr filter handles attribute names
         that might contain underscores or other valid Python identifiers.
         """
-        # Add attribute with underscores
-        self.test_obj.long_attribute_name = "Special Value"
+        # Add attribute with underscores to a copy so the shared fixture stays untouched
+        obj = copy.copy(self.test_obj)
+        obj.long_attribute_name = "Special Value"
 
-        template = Template("{% load common_filters %}{{ obj|get_attr:'long_attribute_name' }}")
-        context = Context({"obj": self.test_obj})
-        result = template.render(context)
+        template = self.templates["long_attribute_name"]
+        result = self._render(template, obj=obj)
 
         self.assertEqual(result, "Special Value")
 
@@ -277,16 +323,8 @@ class GetAttrFilterTest(TestCase):
         Verifies that the get_attr filter works correctly within
         Django template conditional statements.
         """
-        template = Template("""
-            {% load common_filters %}
-            {% if obj|get_attr:'is_active' %}
-                Active
-            {% else %}
-                Inactive
-            {% endif %}
-        """)
-        context = Context({"obj": self.test_obj})
-        result = template.render(context).strip()
+        template = self.templates["conditional"]
+        result = self._render(template, obj=self.test_obj)
 
         self.assertEqual(result, "Active")
 
@@ -296,21 +334,8 @@ class GetAttrFilterTest(TestCase):
         Verifies that the get_attr filter works correctly when
         used within Django template for loops.
         """
-        # Create multiple objects
-        objects = []
-        for i in range(3):
-
-            class TestObject:
-                def __init__(self, name):
-                    self.name = name
-
-            objects.append(TestObject(f"Object {i}"))
-
-        template = Template(
-            """{% load common_filters %}{% for item in objects %}{{ item|get_attr:'name' }}{% if not forloop.last %}, {% endif %}{% endfor %}"""
-        )
-        context = Context({"objects": objects})
-        result = template.render(context)
+        template = self.templates["loop"]
+        result = self._render(template, objects=self.loop_objects)
 
         self.assertEqual(result, "Object 0, Object 1, Object 2")
 
@@ -338,38 +363,88 @@ class GetAttrFilterTest(TestCase):
         Verifies that the template tag library loads without errors
         and filters are available for use.
         """
-        template = Template("{% load common_filters %}Template loaded successfully")
-        context = Context({})
-        result = template.render(context)
+        template = self.templates["load"]
+        result = self._render(template)
 
         self.assertEqual(result, "Template loaded successfully")
 
+    @override_settings(SFD_CACHE_TEMPLATETAG_ATTRS=True)
+    def test_get_attr_with_attribute_cache(self):
+        """Test get_attr results with the attribute cache enabled.
+
+        Verifies that caching returns the same values as uncached lookups,
+        including objects that cannot be cached (None, int, slotted objects),
+        and that repeated lookups are served from the cache.
+        """
+        obj = CacheableObject()
+
+        self.assertEqual(get_attr(obj, "name"), "Cached Name")
+        self.assertIsNone(get_attr(obj, "nonexistent"))
+        self.assertEqual(get_attr(self.test_obj, "name"), "Test Name")
+        self.assertIsNone(get_attr(None, "name"))
+        self.assertIsNone(get_attr(123, "name"))
+
+        # Cached values are returned even if the object changes afterwards
+        obj.name = "Changed Name"
+        self.assertEqual(get_attr(obj, "name"), "Cached Name")
+
+    @override_settings(SFD_CACHE_TEMPLATETAG_ATTRS=True)
+    def test_get_attr_cache_released_with_object(self):
+        """Test that cache entries are dropped when the object is collected.
+
+        Verifies that an object id reused after garbage collection
+        cannot return values cached for the previous object.
+        """
+        obj = CacheableObject()
+        key = id(obj)
+        get_attr(obj, "name")
+        self.assertIn(key, common_filters._attr_cache)
+
+        del obj
+        gc.collect()
+
+        self.assertNotIn(key, common_filters._attr_cache)
+
+    @override_settings(SFD_CACHE_TEMPLATETAG_ATTRS=True)
+    def test_get_attr_cache_released_with_bound_method(self):
+        """Test that resolving a bound method does not keep the object alive.
+
+        Verifies that values referencing the object are not cached, so the
+        object is still collected and its cache entry freed.
+        """
+        obj = CacheableObject()
+        key = id(obj)
+        get_attr(obj, "name")
+        self.assertEqual(get_attr(obj, "get_name")(), "Cached Name")
+
+        del obj
+        gc.collect()
+
+        self.assertNotIn(key, common_filters._attr_cache)
+
+    def test_default_engine_uses_cached_loader(self):
+        """Test that loader-based template lookups are memoized.
+
+        Verifies that the default engine wraps its loaders in Django's
+        cached loader, so ``{% include %}``/``{% extends %}`` lookups are
+        read and parsed from disk only once.
+        """
+        template_loaders = Engine.get_default().template_loaders
+
+        self.assertIsInstance(template_loaders[0], CachedLoader)
+
     def test_multiple_filter_usage(self):
         """Test using multiple instances of get_attr in same template.
 
         Verifies that multiple get_attr filter calls work correctly
         within the same template context.
         """
+        obj = MultiFieldObject()
 
-        class TestObject:
-            def __init__(self):
-                self.title = "Test Title"
-                self.description = "Test Description"
-                self.status = "active"
-
-        obj = TestObject()
+        template = self.templates["multiple"]
+        result = self._render(template, obj=obj)
 
-        template = Template("""
-            {% load common_filters %}
-            Title: {{ obj|get_attr:'title' }}
-            Description: {{ obj|get_attr:'description' }}
-            Status: {{ obj|get_attr:'status' }}
-        """)
-        context = Context({"obj": obj})
-        result = template.render(context).strip()
-
-        expected = "Title: Test Title\n            Description: Test Description\n            Status: active"
-        self.assertEqual(result, expected)
+        self.assertEqual(result.split("|"), ["Title: Test Title", "Description: Test Description", "Status: active"])
 
     def test_get_attr_performance_with_many_calls(self):
         """Test performance of get_attr with multiple calls.
@@ -381,26 +456,27 @@ class GetAttrFilterTest(TestCase):
             This is a basic performance test. For production applications,
             consider more sophisticated performance testing tools.
         """
-        import time
-
-        class TestObject:
-            def __init__(self):
-                self.value = "Test Value"
-
-        obj = TestObject()
-
-        template = Template("""{% load common_filters %}{% for i in range %}{{ obj|get_attr:'value' }}{% endfor %}""")
-
-        # Test with moderate number of calls
-        context = Context({"obj": obj, "range": range(100)})
-
-        start_time = time.time()
-        result = template.render(context)
-        end_time = time.time()
-
-        # Verify result correctness
-        self.assertEqual(result, "Test Value" * 100)
-
-        # Basic performance check (should complete reasonably quickly)
-        execution_time = end_time - start_time
-        self.assertLess(execution_time, 1.0, "Filter execution took too long")
+        obj = ValueObject()
+
+        template = self.templates["performance"]
+
+        # Test with moderate number of calls; the shared context is reused by every trial
+        context = self.base_context
+        with context.push(obj=obj, range=range(100)):
+            # Warm-up render, also used to verify result correctness
+            result = template.render(context)
+            # Check length and boundaries instead of building the 1000-character expected string
+            self.assertEqual(len(result), len("Test Value") * 100)
+            self.assertTrue(result.startswith("Test Value"))
+            self.assertTrue(result.endswith("Test Value"))
+            self.assertEqual(result.count("Test Value"), 100)
+
+            # Take the best of several trials with a monotonic high-resolution clock to filter out scheduler noise
+            trial_times_ns = []
+            for _ in range(5):
+                start_ns = perf_counter_ns()
+                template.render(context)
+                trial_times_ns.append(perf_counter_ns() - start_ns)
+            best_ns = min(trial_times_ns)
+
+        self.assertLess(best_ns, 50_000_000, "Rendering 100 get_attr calls took longer than 50ms")
@@ -6,9 +6,13 @@ This module provides extensive test coverage for CSV upload functionality,
 including form validation, file processing, data conversion, and error handling.
 """
 
+import copy
+import io
 import os
 import tempfile
-from datetime import date, timedelta
+from datetime import date, datetime, time, timedelta
+from decimal import Decimal
+from types import SimpleNamespace
 from unittest import TestCase
 from unittest.mock import Mock, patch
 
@@ -16,16 +20,17 @@ import pytest
 from django import forms
 from django.contrib import admin
 from django.contrib.admin.sites import AdminSite
-from django.contrib.messages.storage.fallback import FallbackStorage
-from django.core.files.uploadedfile import SimpleUploadedFile
-from django.db import models
-from django.http import HttpResponse
-from django.test import RequestFactory
+from django.core.files.uploadedfile import SimpleUploadedFile, TemporaryUploadedFile
+from django.core.files.uploadhandler import TemporaryFileUploadHandler
+from django.db import IntegrityError, connection, models
+from django.http import HttpResponse, QueryDict
+from django.test import RequestFactory, override_settings
 from django.utils import timezone, translation
+from django.utils.datastructures import MultiValueDict
 
 from sfd.models.csv_log import CsvLog
 from sfd.tests.unittest import BaseTestMixin, TestBaseModel, TestEncryptedModel, TestMasterModel, TestModel
-from sfd.views.common.upload import BaseModelUploadMixin, Encoding, MasterModelUploadMixin, UploadForm, UploadMixin, UploadType
+from sfd.views.common.upload import BaseModelUploadMixin, Encoding, MasterModelUploadMixin, UploadForm, UploadMixin, UploadType, _to_copy_value
 
 
 class TestModelAdmin(UploadMixin, admin.ModelAdmin):
@@ -45,24 +50,18 @@ class TestMasterModelAdmin(MasterModelUploadMixin, admin.ModelAdmin):
 class UploadTypeTest(TestCase):
     """Test UploadType TextChoices class functionality."""
 
-    def test_upload_type_choices(self):
-        """Test UploadType choices are properly defined."""
-        self.assertEqual(UploadType.CSV, "csv")
-        self.assertEqual(UploadType.EXCEL, "excel")
-
-    def test_upload_type_labels(self):
-        """Test UploadType labels are properly internationalized."""
-        choices = UploadType.choices
-        self.assertEqual(len(choices), 3)
-        self.assertIn(("csv", "CSV"), choices)
-        self.assertIn(("excel", "Excel"), choices)
-        self.assertIn(("zip", "ZIP"), choices)
-
-    def test_upload_type_values(self):
-        """Test UploadType value retrieval."""
-        self.assertEqual(str(UploadType.CSV), "csv")
-        self.assertEqual(str(UploadType.EXCEL), "excel")
-        self.assertEqual(str(UploadType.ZIP), "zip")
+    def test_upload_type(self):
+        """Test UploadType values, string conversion and choices."""
+        self.assertEqual(len(UploadType.choices), 3)
+        for enum_val, str_val, label in [
+            (UploadType.CSV, "csv", "CSV"),
+            (UploadType.EXCEL, "excel", "Excel"),
+            (UploadType.ZIP, "zip", "ZIP"),
+        ]:
+            with self.subTest(enum=enum_val):
+                self.assertEqual(enum_val, str_val)
+                self.assertEqual(str(enum_val), str_val)
+                self.assertIn((str_val, label), UploadType.choices)
 
 
 @pytest.mark.unit
@@ -70,22 +69,17 @@ class UploadTypeTest(TestCase):
 class EncodingTest(TestCase):
     """Test Encoding TextChoices class functionality."""
 
-    def test_encoding_choices(self):
-        """Test Encoding choices are properly defined."""
-        self.assertEqual(Encoding.UTF8, "utf-8")
-        self.assertEqual(Encoding.SJIS, "shift-jis")
-
-    def test_encoding_labels(self):
-        """Test Encoding labels are properly defined."""
-        choices = Encoding.choices
-        self.assertEqual(len(choices), 2)
-        self.assertIn(("utf-8", "UTF-8"), choices)
-        self.assertIn(("shift-jis", "Shift-JIS"), choices)
-
-    def test_encoding_values(self):
-        """Test Encoding value retrieval."""
-        self.assertEqual(str(Encoding.UTF8), "utf-8")
-        self.assertEqual(str(Encoding.SJIS), "shift-jis")
+    def test_encoding(self):
+        """Test Encoding values, string conversion and choices."""
+        self.assertEqual(len(Encoding.choices), 2)
+        for enum_val, str_val, label in [
+            (Encoding.UTF8, "utf-8", "UTF-8"),
+            (Encoding.SJIS, "shift-jis", "Shift-JIS"),
+        ]:
+            with self.subTest(enum=enum_val):
+                self.assertEqual(enum_val, str_val)
+                self.assertEqual(str(enum_val), str_val)
+                self.assertIn((str_val, label), Encoding.choices)
 
 
 @pytest.mark.unit
@@ -93,25 +87,31 @@ class EncodingTest(TestCase):
 class UploadFormTest(TestCase):
     """Test UploadForm functionality and validation."""
 
+    @classmethod
+    def setUpClass(cls):
+        """Build one unbound form shared by the read-only field introspection tests."""
+        super().setUpClass()
+        cls._empty_form = UploadForm()
+
     def test_upload_form_fields(self):
         """Test UploadForm has required fields."""
-        form = UploadForm()
-        self.assertIn("upload_file", form.fields)
-        self.assertIn("upload_type", form.fields)
-        self.assertIn("encoding", form.fields)
+        fields = self._empty_form.fields
+        self.assertIn("upload_file", fields)
+        self.assertIn("upload_type", fields)
+        self.assertIn("encoding", fields)
 
     def test_upload_form_field_types(self):
         """Test UploadForm field types are correct."""
-        form = UploadForm()
-        self.assertIsInstance(form.fields["upload_file"], forms.FileField)
-        self.assertIsInstance(form.fields["upload_type"], forms.ChoiceField)
-        self.assertIsInstance(form.fields["encoding"], forms.ChoiceField)
+        fields = self._empty_form.fields
+        self.assertIsInstance(fields["upload_file"], forms.FileField)
+        self.assertIsInstance(fields["upload_type"], forms.ChoiceField)
+        self.assertIsInstance(fields["encoding"], forms.ChoiceField)
 
     def test_upload_form_choices(self):
         """Test UploadForm choice fields have correct options."""
-        form = UploadForm()
-        self.assertEqual(form.fields["upload_type"].choices, UploadType.choices)
-        self.assertEqual(form.fields["encoding"].choices, Encoding.choices)
+        fields = self._empty_form.fields
+        self.assertEqual(fields["upload_type"].choices, UploadType.choices)
+        self.assertEqual(fields["encoding"].choices, Encoding.choices)
 
     def test_upload_form_valid_data(self):
         """Test UploadForm validation with valid data."""
@@ -144,9 +144,57 @@ class UploadFormTest(TestCase):
         self.assertIn("encoding", form.errors)
 
 
+# Pre-encoded CSV payloads shared by the upload tests
+CSV_BYTES = b"name,email\nJohn Doe,john@example.com"
+CSV1_BYTES = b"name,email\nTest1,test1@example.com"
+CSV2_BYTES = b"name,email\nTest2,test2@example.com"
+
+# Reader rows mixing skipped empty/falsy entries with real rows
+EMPTY_AND_FILLED_ROWS = (
+    None,  # Empty row (should be skipped)
+    {"name": "Alice", "email": "alice@example.com"},
+    {},  # Empty dict (should be skipped)
+    {"name": "Bob", "email": "bob@example.com"},
+    False,  # Falsy value (should be skipped)
+    {"name": "Charlie", "email": "charlie@example.com"},
+)
+
+
+def _resolve_upload_fields(model_admin_class, model, column_names):
+    """Return get_upload_db_fields for the given admin, model and upload_column_names."""
+    model_admin = model_admin_class(model, AdminSite())
+    model_admin.upload_column_names = column_names
+    return model_admin.get_upload_db_fields(None)
+
+
+def _field_mock(internal_type):
+    """Return a new model field mock reporting the given internal type."""
+    mock_field = Mock()
+    mock_field.get_internal_type.return_value = internal_type
+    return mock_field
+
+
+def _reset_upload_state(model_admin):
+    """Initialize the per-upload attributes that upload_file sets before reading a file."""
+    model_admin._bulk_create_list = []
+    model_admin._bulk_update_list = []
+    model_admin._uploaded_unique_values = set()  # 今回アップロードしたCSVのユニーク値
+    model_admin._total_inserted = 0  # Track total inserted across chunks
+    model_admin._total_updated = 0  # Track total updated across chunks
+    model_admin._upload_datetime = timezone.now()
+
+
+def _mock_get_client_ip(request):
+    """Mock implementation of get_client_ip."""
+    x_forwarded_for = request.META.get("HTTP_X_FORWARDED_FOR")
+    if x_forwarded_for:
+        return x_forwarded_for.split(",")[0]
+    return request.META.get("REMOTE_ADDR")
+
+
 def create_test_csv_file(content, filename="test.csv"):
-    """Create a test CSV file for upload testing."""
-    return SimpleUploadedFile(filename, content.encode("utf-8"), content_type="text/csv")
+    """Create a test CSV file for upload testing from already-encoded bytes."""
+    return SimpleUploadedFile(filename, content, content_type="text/csv")
 
 
 @pytest.mark.unit
@@ -154,36 +202,55 @@ def create_test_csv_file(content, filename="test.csv"):
 class UploadMixinTest(BaseTestMixin, TestCase):
     """Test UploadMixin functionality with comprehensive coverage."""
 
-    databases = ["default", "postgres"]
+    @classmethod
+    def setUpClass(cls):
+        """Build the admin site once for the whole class."""
+        super().setUpClass()
+        cls.admin_site = AdminSite()
+
+        # POST data of a plain UTF-8 CSV upload; the request factory copies it, so one dict serves every test
+        cls._upload_post_data = {"upload_type": UploadType.CSV, "encoding": Encoding.UTF8}
+
+        # WSGI environ of a plain GET request; get_client_ip only reads request.META
+        cls._base_meta = dict(RequestFactory().get("/test/").META)
+
+        # Messages are asserted in English; activate it once for the class instead of per test
+        translation_override = translation.override("en")
+        translation_override.__enter__()
+        cls.addClassCleanup(translation_override.__exit__, None, None, None)
+
+        # Resolve the upload URL without the admin URLconf; patched once for the class instead of per test
+        reverse_patcher = patch("sfd.views.common.upload.reverse", return_value="/admin/testmodel/upload/")
+        cls.mock_reverse = reverse_patcher.start()
+        cls.addClassCleanup(reverse_patcher.stop)
 
     def setUp(self):
-        """Set up test environment with model admin instance."""
+        """Set up test environment with a new model admin instance."""
         super().setUp()
-        self.admin_site = AdminSite()
         self.model_admin = TestModelAdmin(TestModel, self.admin_site)
 
-        self.request = self.factory.get("/admin/")
-        self.request.user = self.user
-
-        self.model_admin._bulk_create_list = []
-        self.model_admin._bulk_update_list = []
-        self.model_admin._uploaded_unique_values = set()  # 今回アップロードしたCSVのユニーク値
-        self.model_admin._total_inserted = 0  # Track total inserted across chunks
-        self.model_admin._total_updated = 0  # Track total updated across chunks
-        self.model_admin._upload_datetime = timezone.now()
-
         # Mock get_app_name method for all tests
         self.model_admin.get_app_name = lambda: "sfd"
 
         # Mock get_client_ip method for all tests
-        def mock_get_client_ip(request):
-            """Mock implementation of get_client_ip."""
-            x_forwarded_for = request.META.get("HTTP_X_FORWARDED_FOR")
-            if x_forwarded_for:
-                return x_forwarded_for.split(",")[0]
-            return request.META.get("REMOTE_ADDR")
+        self.model_admin.get_client_ip = _mock_get_client_ip
+        _reset_upload_state(self.model_admin)
+
+        self.request = self.factory.get("/admin/")
+        self.request.user = self.user
+
+    def _build_messaging_request(self, data, files=None):
+        """Build a POST upload request with message storage attached.
 
-        self.model_admin.get_client_ip = mock_get_client_ip
+        Returns:
+            tuple: The request and its FallbackStorage, whose queued messages the tests inspect
+        """
+        request, storage = self.create_messaging_request("/admin/upload/")
+        # Attach the form data and files directly instead of encoding and re-parsing a multipart body
+        request.POST = QueryDict(mutable=True)
+        request.POST.update(data)
+        request._files = MultiValueDict({name: [uploaded_file] for name, uploaded_file in (files or {}).items()})  # type: ignore[attr-defined]
+        return request, storage
 
     def test_mixin_initialization(self):
         """Test UploadMixin initialization sets correct attributes."""
@@ -195,6 +262,14 @@ class UploadMixinTest(BaseTestMixin, TestCase):
         self.assertEqual(self.model_admin.upload_model, None)
         self.assertEqual(self.model_admin.chunk_size, 10000)
 
+    def test_chunk_size_from_settings(self):
+        """Test chunk_size defaults to SFD_BULK_CREATE_BATCH_SIZE unless set on the admin class."""
+        with override_settings(SFD_BULK_CREATE_BATCH_SIZE=500):
+            self.assertEqual(TestModelAdmin(TestModel, self.admin_site).chunk_size, 500)
+
+            with patch.object(TestModelAdmin, "chunk_size", 50):
+                self.assertEqual(TestModelAdmin(TestModel, self.admin_site).chunk_size, 50)
+
     def test_upload_url_name_generation(self):
         """Test upload URL name is generated correctly."""
         expected_name = "sfd_testmodel_upload_file"
@@ -328,9 +403,23 @@ class UploadMixinTest(BaseTestMixin, TestCase):
         upload_url = urls[0]
         self.assertEqual(str(upload_url.pattern), "upload_file/")
 
+    def test_get_urls_spools_uploads_to_disk(self):
+        """Test the upload URL replaces the upload handlers before handing the request to the admin view."""
+        admin_upload_view = Mock(return_value=HttpResponse("ok"))
+        with patch.object(self.model_admin.admin_site, "admin_view", return_value=admin_upload_view):
+            upload_view = self.model_admin.get_urls()[0].callback
+
+        request = RequestFactory().post("/test/")
+        response = upload_view(request)
+
+        self.assertEqual(response.content, b"ok")
+        self.assertTrue(upload_view.csrf_exempt)
+        self.assertEqual([type(handler) for handler in request.upload_handlers], [TemporaryFileUploadHandler])
+        admin_upload_view.assert_called_once_with(request)
+
     def test_get_client_ip_with_x_forwarded_for(self):
         """Test get_client_ip extracts IP from X-Forwarded-For header."""
-        request = self.factory.get("/test/")
+        request = SimpleNamespace(META=dict(self._base_meta))
         request.META["HTTP_X_FORWARDED_FOR"] = "203.0.113.195, 70.41.3.18, 150.172.238.178"
         request.META["REMOTE_ADDR"] = "192.168.1.1"
 
@@ -339,7 +428,7 @@ class UploadMixinTest(BaseTestMixin, TestCase):
 
     def test_get_client_ip_without_x_forwarded_for(self):
         """Test get_client_ip uses REMOTE_ADDR when X-Forwarded-For is not present."""
-        request = self.factory.get("/test/")
+        request = SimpleNamespace(META=dict(self._base_meta))
         request.META["REMOTE_ADDR"] = "192.168.1.100"
 
         ip = self.model_admin.get_client_ip(request)
@@ -347,10 +436,9 @@ class UploadMixinTest(BaseTestMixin, TestCase):
 
     def test_get_client_ip_no_ip(self):
         """Test get_client_ip returns None when no IP is available."""
-        request = self.factory.get("/test/")
+        request = SimpleNamespace(META=dict(self._base_meta))
         # RequestFactory sets REMOTE_ADDR to 127.0.0.1 by default, so we need to remove it
-        if "REMOTE_ADDR" in request.META:
-            del request.META["REMOTE_ADDR"]
+        request.META.pop("REMOTE_ADDR", None)
 
         ip = self.model_admin.get_client_ip(request)
         self.assertIsNone(ip)
@@ -360,8 +448,7 @@ class UploadMixinTest(BaseTestMixin, TestCase):
         app_name = self.model_admin.get_app_name()
         self.assertEqual(app_name, "sfd")
 
-    @patch("sfd.views.common.upload.reverse", return_value="/test/testbasemodel/upload/")
-    def test_get_context_data(self, mock_reverse):
+    def test_get_context_data(self):
         """Test get_context_data hides encoding field for Excel upload type."""
 
         context = self.model_admin.get_context_data()
@@ -372,8 +459,7 @@ class UploadMixinTest(BaseTestMixin, TestCase):
         self.assertIn("upload_title", context)
         self.assertIn("upload_button_name", context)
 
-    @patch("sfd.views.common.upload.reverse", return_value="/test/testbasemodel/upload/")
-    def test_get_context_data_with_excel_upload_type(self, mock_reverse):
+    def test_get_context_data_with_excel_upload_type(self):
         """Test get_context_data hides encoding field for Excel upload type."""
         # Set upload type to Excel
         self.model_admin.upload_type = UploadType.EXCEL
@@ -390,8 +476,7 @@ class UploadMixinTest(BaseTestMixin, TestCase):
         form = context["form"]
         self.assertIsInstance(form.fields["encoding"].widget, forms.HiddenInput)
 
-    @patch("sfd.views.common.upload.reverse", return_value="/test/testbasemodel/upload/")
-    def test_get_context_data_with_custom_form(self, mock_reverse):
+    def test_get_context_data_with_custom_form(self):
         """Test get_context_data uses provided form instead of creating new one."""
         # Create custom form
         custom_form = UploadForm(initial={"upload_type": UploadType.ZIP, "encoding": Encoding.SJIS})
@@ -427,8 +512,7 @@ class UploadMixinTest(BaseTestMixin, TestCase):
         expected = ["name"]
         self.assertEqual(result, expected)
 
-    @patch("sfd.views.common.upload.reverse", return_value="/test/testbasemodel/upload/")
-    def test_upload_file_get_request(self, mock_reverse):
+    def test_upload_file_get_request(self):
         """Test upload_file view with GET request returns form."""
         # Mock the render function to capture context
         with patch("sfd.views.common.upload.render") as mock_render:
@@ -448,86 +532,66 @@ class UploadMixinTest(BaseTestMixin, TestCase):
             self.assertIsInstance(context["form"], UploadForm)
 
     @pytest.mark.django_db(databases=["default", "postgres"])
-    @patch("sfd.views.common.upload.reverse", return_value="/admin/testmodel/upload/")
     @patch.object(TestModelAdmin, "_process_bulk_operations")
-    def test_upload_file_post_csv(self, mock_process, mock_reverse):
+    def test_upload_file_post_csv(self, mock_process):
         """Test upload_file view with successful POST request."""
         # Setup mocks
         self.model_admin.upload_column_names = ["name", "email"]
 
         # Create test CSV
-        csv_content = "name,email\nJohn Doe,john@example.com"
-        csv_file = create_test_csv_file(csv_content)
+        csv_file = create_test_csv_file(CSV_BYTES)
 
         # Create POST request
-        request = self.factory.post("/admin/upload/", {"upload_type": UploadType.CSV, "encoding": Encoding.UTF8}, format="multipart")
-        request.FILES["upload_file"] = csv_file
-        request.user = self.user
-
-        # Setup message storage for the request
-        request.session = {}  # type: ignore[attr-defined]
-        storage = FallbackStorage(request)
-        request._messages = storage  # type: ignore[attr-defined]
+        request, storage = self._build_messaging_request(self._upload_post_data, {"upload_file": csv_file})
 
-        with translation.override("en"):
-            # Test upload
-            response = self.model_admin.upload_file(request)
+        # Test upload
+        response = self.model_admin.upload_file(request)
 
-            # Verify redirect
-            self.assertEqual(response.status_code, 200)
-            self.assertTrue(isinstance(response, HttpResponse))
+        # Verify redirect
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(isinstance(response, HttpResponse))
 
-            # Verify bulk_create was called
-            mock_process.assert_called_once()
-            self.assertEqual(len(self.model_admin._bulk_create_list), 1)
+        # Verify bulk_create was called
+        mock_process.assert_called_once()
+        self.assertEqual(len(self.model_admin._bulk_create_list), 1)
 
-            # Verify success message was added
-            messages = list(storage)
-            self.assertEqual(len(messages), 1)
-            self.assertIn("Upload completed.", str(messages[0]))
-            self.assertIn("Inserted:", str(messages[0]))
+        # Verify success message was added
+        messages = storage._queued_messages
+        self.assertEqual(len(messages), 1)
+        self.assertIn("Upload completed.", str(messages[0]))
+        self.assertIn("Inserted:", str(messages[0]))
 
     @pytest.mark.django_db(databases=["default", "postgres"])
-    @patch("sfd.views.common.upload.reverse", return_value="/admin/testmodel/upload/")
     @patch.object(TestModelAdmin, "_process_bulk_operations")
-    def test_upload_file_post_htmx(self, mock_process, mock_reverse):
+    def test_upload_file_post_htmx(self, mock_process):
         """Test upload_file view with successful POST request."""
         # Setup mocks
         self.model_admin.upload_column_names = ["name", "email"]
 
         # Create test CSV
-        csv_content = "name,email\nJohn Doe,john@example.com"
-        csv_file = create_test_csv_file(csv_content)
+        csv_file = create_test_csv_file(CSV_BYTES)
 
         # Create POST request
-        request = self.factory.post("/admin/upload/", {"upload_type": UploadType.CSV, "encoding": Encoding.UTF8}, format="multipart")
-        request.FILES["upload_file"] = csv_file
-        request.user = self.user
+        request, storage = self._build_messaging_request(self._upload_post_data, {"upload_file": csv_file})
         request.headers = {"HX-Request": "true"}  # Mark as HTMX request
 
-        # Setup message storage for the request
-        request.session = {}  # type: ignore[attr-defined]
-        storage = FallbackStorage(request)
-        request._messages = storage  # type: ignore[attr-defined]
-
-        with translation.override("en"):
-            # Test upload
-            response = self.model_admin.upload_file(request)
+        # Test upload
+        response = self.model_admin.upload_file(request)
 
-            # Verify redirect
-            self.assertEqual(response.status_code, 200)
-            self.assertTrue(isinstance(response, HttpResponse))
-            self.assertEqual(response["HX-Trigger"], "uploadSuccess")
+        # Verify redirect
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(isinstance(response, HttpResponse))
+        self.assertEqual(response["HX-Trigger"], "uploadSuccess")
 
-            # Verify bulk_create was called
-            mock_process.assert_called_once()
-            self.assertEqual(len(self.model_admin._bulk_create_list), 1)
+        # Verify bulk_create was called
+        mock_process.assert_called_once()
+        self.assertEqual(len(self.model_admin._bulk_create_list), 1)
 
-            # Verify success message was added
-            messages = list(storage)
-            self.assertEqual(len(messages), 1)
-            self.assertIn("Upload completed.", str(messages[0]))
-            self.assertIn("Inserted:", str(messages[0]))
+        # Verify success message was added
+        messages = storage._queued_messages
+        self.assertEqual(len(messages), 1)
+        self.assertIn("Upload completed.", str(messages[0]))
+        self.assertIn("Inserted:", str(messages[0]))
 
     def test_upload_file_excel_upload_not_implemented(self):
         """Test excel_upload raises NotImplementedError."""
@@ -535,23 +599,14 @@ class UploadMixinTest(BaseTestMixin, TestCase):
             self.model_admin.excel_upload(Mock(), self.request)
 
     @pytest.mark.django_db(databases=["default", "postgres"])
-    @patch("sfd.views.common.upload.reverse", return_value="/admin/testmodel/upload/")
     @patch.object(TestModelAdmin, "excel_upload")
-    def test_upload_file_excel(self, mock_excel_upload, mock_reverse):
+    def test_upload_file_excel(self, mock_excel_upload):
         """Test Excel upload functionality."""
         # Create test CSV
-        csv_content = "name,email\nJohn Doe,john@example.com"
-        csv_file = create_test_csv_file(csv_content)
+        csv_file = create_test_csv_file(CSV_BYTES)
 
         # Create POST request
-        request = self.factory.post("/admin/upload/", {"upload_type": UploadType.EXCEL, "encoding": Encoding.UTF8}, format="multipart")
-        request.FILES["upload_file"] = csv_file
-        request.user = self.user
-
-        # Setup message storage for the request
-        request.session = {}  # type: ignore[attr-defined]
-        storage = FallbackStorage(request)
-        request._messages = storage  # type: ignore[attr-defined]
+        request, storage = self._build_messaging_request({"upload_type": UploadType.EXCEL, "encoding": Encoding.UTF8}, {"upload_file": csv_file})
 
         # Test upload
         self.model_admin.upload_file(request)
@@ -565,50 +620,27 @@ class UploadMixinTest(BaseTestMixin, TestCase):
         self.assertIn("encoding", args[2])
 
     @pytest.mark.django_db(databases=["default", "postgres"])
-    @patch("sfd.views.common.upload.reverse", return_value="/admin/testmodel/upload/")
     @patch.object(TestModelAdmin, "zip_upload")
     @patch.object(TestModelAdmin, "_process_bulk_operations")
-    def test_zip_upload(self, mock_process, mock_zip_upload, mock_reverse):
+    def test_zip_upload(self, mock_process, mock_zip_upload):
         """Test Zip upload functionality."""
 
         self.model_admin.upload_column_names = ["name", "email"]
 
-        # Create test CSV files in memory
-        csv_content1 = "name,email\nTest1,test1@example.com"
-        csv_content2 = "name,email\nTest2,test2@example.com"
+        # Extracted CSV files as in-memory file objects; get_csv_reader accepts them like uploaded files
+        csv_file1 = io.BytesIO(CSV1_BYTES)
+        csv_file1.name = "test1.csv"
+        csv_file2 = io.BytesIO(CSV2_BYTES)
+        csv_file2.name = "test2.csv"
 
-        # Create temporary CSV files
-        temp_dir = tempfile.mkdtemp()
-        csv_file1 = os.path.join(temp_dir, "test1.csv")
-        csv_file2 = os.path.join(temp_dir, "test2.csv")
-
-        with open(csv_file1, "w", encoding="utf-8") as f:
-            f.write(csv_content1)
-        with open(csv_file2, "w", encoding="utf-8") as f:
-            f.write(csv_content2)
-
-        # Mock zip_upload to return the CSV file paths
+        # Mock zip_upload to return the CSV files
         mock_zip_upload.return_value = [csv_file1, csv_file2]
 
         # Create a zip file for the request (content doesn't matter since we're mocking)
         zip_file = SimpleUploadedFile("test.zip", b"dummy content", content_type="application/zip")
 
         # Create POST request
-        request = self.factory.post(
-            "/admin/upload/",
-            {
-                "upload_type": UploadType.ZIP,
-                "encoding": Encoding.UTF8,
-            },
-            format="multipart",
-        )
-        request.FILES["upload_file"] = zip_file
-        request.user = self.user
-
-        # Setup message storage for the request
-        request.session = {}  # type: ignore[attr-defined]
-        storage = FallbackStorage(request)
-        request._messages = storage  # type: ignore[attr-defined]
+        request, storage = self._build_messaging_request({"upload_type": UploadType.ZIP, "encoding": Encoding.UTF8}, {"upload_file": zip_file})
 
         # Setup mock side effect to simulate inserting records
         def side_effect(upload_fields):
@@ -616,26 +648,28 @@ class UploadMixinTest(BaseTestMixin, TestCase):
 
         mock_process.side_effect = side_effect
 
-        with translation.override("en"):
+        with patch.object(self.model_admin, "get_upload_db_fields", wraps=self.model_admin.get_upload_db_fields) as mock_get_fields:
             # Test upload
             self.model_admin.upload_file(request)
 
             # Verify zip_upload was called
             mock_zip_upload.assert_called_once()
 
+            # Verify the upload fields were resolved once and shared by both CSV files
+            mock_get_fields.assert_called_once()
+
             # Verify _process_bulk_operations was called for each CSV file in the ZIP
             self.assertEqual(mock_process.call_count, 2)
 
             # Verify success message was added (one message for the entire ZIP file)
-            messages = list(storage)
+            messages = storage._queued_messages
             self.assertEqual(len(messages), 1)
             self.assertIn("Upload completed.", str(messages[0]))
             self.assertIn("Inserted: 2 rows", str(messages[0]))
 
     @pytest.mark.django_db(databases=["default", "postgres"])
-    @patch("sfd.views.common.upload.reverse", return_value="/admin/testmodel/upload/")
     @patch.object(TestModelAdmin, "upload_data")
-    def test_upload_file_exception_handling(self, mock_upload_data, mock_reverse):
+    def test_upload_file_exception_handling(self, mock_upload_data):
         """Test upload_file handles exceptions properly."""
         self.model_admin.upload_column_names = ["name", "email"]
 
@@ -643,41 +677,31 @@ class UploadMixinTest(BaseTestMixin, TestCase):
         mock_upload_data.side_effect = ValueError("Test error message")
 
         # Create test CSV
-        csv_content = "name,email\nJohn Doe,john@example.com"
-        csv_file = create_test_csv_file(csv_content)
+        csv_file = create_test_csv_file(CSV_BYTES)
 
         # Create POST request
-        request = self.factory.post("/admin/upload/", {"upload_type": UploadType.CSV, "encoding": Encoding.UTF8}, format="multipart")
-        request.FILES["upload_file"] = csv_file
-        request.user = self.user
-
-        # Setup message storage for the request
-        request.session = {}  # type: ignore[attr-defined]
-        storage = FallbackStorage(request)
-        request._messages = storage  # type: ignore[attr-defined]
+        request, storage = self._build_messaging_request(self._upload_post_data, {"upload_file": csv_file})
 
-        with translation.override("en"):
-            # Test upload
-            response = self.model_admin.upload_file(request)
+        # Test upload
+        response = self.model_admin.upload_file(request)
 
-            # Verify response is still successful (error is handled gracefully)
-            self.assertEqual(response.status_code, 200)
+        # Verify response is still successful (error is handled gracefully)
+        self.assertEqual(response.status_code, 200)
 
-            # Verify error message was added
-            messages = list(storage)
-            self.assertGreaterEqual(len(messages), 1)
+        # Verify error message was added
+        messages = storage._queued_messages
+        self.assertGreaterEqual(len(messages), 1)
 
-            # Check that an error message with error key was added
-            error_messages = [str(m) for m in messages]
-            self.assertTrue(
-                any("An unexpected error has occurred" in msg and "error key" in msg for msg in error_messages),
-                f"Expected error message not found. Messages: {error_messages}",
-            )
+        # Check that an error message with error key was added
+        error_messages = [str(m) for m in messages]
+        self.assertTrue(
+            any("An unexpected error has occurred" in msg and "error key" in msg for msg in error_messages),
+            f"Expected error message not found. Messages: {error_messages}",
+        )
 
     @pytest.mark.django_db(databases=["default", "postgres"])
-    @patch("sfd.views.common.upload.reverse", return_value="/admin/testmodel/upload/")
     @patch.object(TestModelAdmin, "zip_upload")
-    def test_upload_file_zip_no_csv_exception(self, mock_zip_upload, mock_reverse):
+    def test_upload_file_zip_no_csv_exception(self, mock_zip_upload):
         """Test upload_file handles ZIP with no CSV files exception."""
         self.model_admin.upload_column_names = ["name", "email"]
 
@@ -688,91 +712,66 @@ class UploadMixinTest(BaseTestMixin, TestCase):
         zip_file = SimpleUploadedFile("test.zip", b"dummy content", content_type="application/zip")
 
         # Create POST request
-        request = self.factory.post(
-            "/admin/upload/",
-            {
-                "upload_type": UploadType.ZIP,
-                "encoding": Encoding.UTF8,
-            },
-            format="multipart",
-        )
-        request.FILES["upload_file"] = zip_file
-        request.user = self.user
-
-        # Setup message storage for the request
-        request.session = {}  # type: ignore[attr-defined]
-        storage = FallbackStorage(request)
-        request._messages = storage  # type: ignore[attr-defined]
+        request, storage = self._build_messaging_request({"upload_type": UploadType.ZIP, "encoding": Encoding.UTF8}, {"upload_file": zip_file})
 
-        with translation.override("en"):
-            # Test upload
-            response = self.model_admin.upload_file(request)
+        # Test upload
+        response = self.model_admin.upload_file(request)
 
-            # Verify response is still successful (error is handled gracefully)
-            self.assertEqual(response.status_code, 200)
+        # Verify response is still successful (error is handled gracefully)
+        self.assertEqual(response.status_code, 200)
 
-            # Verify error message was added
-            messages = list(storage)
-            self.assertGreaterEqual(len(messages), 1)
+        # Verify error message was added
+        messages = storage._queued_messages
+        self.assertGreaterEqual(len(messages), 1)
 
-            # Check that an error message with error key was added
-            error_messages = [str(m) for m in messages]
-            self.assertTrue(
-                any("An unexpected error has occurred" in msg and "error key" in msg for msg in error_messages),
-                f"Expected error message not found. Messages: {error_messages}",
-            )
+        # Check that an error message with error key was added
+        error_messages = [str(m) for m in messages]
+        self.assertTrue(
+            any("An unexpected error has occurred" in msg and "error key" in msg for msg in error_messages),
+            f"Expected error message not found. Messages: {error_messages}",
+        )
 
     @pytest.mark.django_db(databases=["default", "postgres"])
-    @patch("sfd.views.common.upload.reverse", return_value="/admin/testmodel/upload/")
     @patch.object(TestModelAdmin, "_process_bulk_operations")
-    def test_upload_file_creates_csv_log_success(self, mock_process, mock_reverse):
+    def test_upload_file_creates_csv_log_success(self, mock_process):
         """Test that upload_file creates a CSV log record on successful upload."""
         from sfd.models.csv_log import CsvProcessResult, CsvProcessType
 
         self.model_admin.upload_column_names = ["name", "email"]
 
         # Create test CSV
-        csv_content = "name,email\nJohn Doe,john@example.com\nJane Smith,jane@example.com"
+        csv_content = b"name,email\nJohn Doe,john@example.com\nJane Smith,jane@example.com"
         csv_file = create_test_csv_file(csv_content)
 
         # Create POST request
-        request = self.factory.post("/admin/upload/", {"upload_type": UploadType.CSV, "encoding": Encoding.UTF8}, format="multipart")
-        request.FILES["upload_file"] = csv_file
-        request.user = self.user
+        request, storage = self._build_messaging_request(self._upload_post_data, {"upload_file": csv_file})
         request.META["REMOTE_ADDR"] = "127.0.0.1"
 
-        # Setup message storage for the request
-        request.session = {}  # type: ignore[attr-defined]
-        storage = FallbackStorage(request)
-        request._messages = storage  # type: ignore[attr-defined]
-
-        with translation.override("en"):
-            # Verify no CSV log records exist before upload
-            self.assertEqual(CsvLog.objects.count(), 0)
+        # Verify no CSV log records exist before upload
+        self.assertEqual(CsvLog.objects.count(), 0)
 
-            # Test upload
-            response = self.model_admin.upload_file(request)
+        # Test upload
+        response = self.model_admin.upload_file(request)
 
-            # Verify response is successful
-            self.assertEqual(response.status_code, 200)
+        # Verify response is successful
+        self.assertEqual(response.status_code, 200)
 
-            # Verify CSV log record was created
-            self.assertEqual(CsvLog.objects.count(), 1)
-            csv_log = CsvLog.objects.first()
+        # Verify CSV log record was created
+        self.assertEqual(CsvLog.objects.count(), 1)
+        csv_log = CsvLog.objects.first()
 
-            # Verify log record fields
-            self.assertEqual(csv_log.process_type, CsvProcessType.UPLOAD)
-            self.assertEqual(csv_log.process_result, CsvProcessResult.SUCCESS)
-            self.assertEqual(csv_log.app_name, "sfd")
-            self.assertEqual(csv_log.processed_by, self.user.username)
-            self.assertEqual(csv_log.ip_address, "127.0.0.1")
-            self.assertEqual(csv_log.file_name, "test.csv")
-            self.assertEqual(csv_log.total_line, 2)  # Two data rows (excluding header)
+        # Verify log record fields
+        self.assertEqual(csv_log.process_type, CsvProcessType.UPLOAD)
+        self.assertEqual(csv_log.process_result, CsvProcessResult.SUCCESS)
+        self.assertEqual(csv_log.app_name, "sfd")
+        self.assertEqual(csv_log.processed_by, self.user.username)
+        self.assertEqual(csv_log.ip_address, "127.0.0.1")
+        self.assertEqual(csv_log.file_name, "test.csv")
+        self.assertEqual(csv_log.total_line, 2)  # Two data rows (excluding header)
 
     @pytest.mark.django_db(databases=["default", "postgres"])
-    @patch("sfd.views.common.upload.reverse", return_value="/admin/testmodel/upload/")
     @patch.object(TestModelAdmin, "upload_data")
-    def test_upload_file_creates_csv_log_failure(self, mock_upload_data, mock_reverse):
+    def test_upload_file_creates_csv_log_failure(self, mock_upload_data):
         """Test that upload_file creates a CSV log record on failed upload."""
         from sfd.models.csv_log import CsvProcessResult, CsvProcessType
 
@@ -782,42 +781,49 @@ class UploadMixinTest(BaseTestMixin, TestCase):
         mock_upload_data.side_effect = ValueError("Test error")
 
         # Create test CSV
-        csv_content = "name,email\nJohn Doe,john@example.com"
-        csv_file = create_test_csv_file(csv_content)
+        csv_file = create_test_csv_file(CSV_BYTES)
 
         # Create POST request
-        request = self.factory.post("/admin/upload/", {"upload_type": UploadType.CSV, "encoding": Encoding.UTF8}, format="multipart")
-        request.FILES["upload_file"] = csv_file
-        request.user = self.user
+        request, storage = self._build_messaging_request(self._upload_post_data, {"upload_file": csv_file})
         request.META["REMOTE_ADDR"] = "192.168.1.100"
 
-        # Setup message storage for the request
-        request.session = {}  # type: ignore[attr-defined]
-        storage = FallbackStorage(request)
-        request._messages = storage  # type: ignore[attr-defined]
+        # Verify no CSV log records exist before upload
+        self.assertEqual(CsvLog.objects.count(), 0)
 
-        with translation.override("en"):
-            # Verify no CSV log records exist before upload
-            self.assertEqual(CsvLog.objects.count(), 0)
+        # Test upload
+        response = self.model_admin.upload_file(request)
 
-            # Test upload
-            response = self.model_admin.upload_file(request)
+        # Verify response
+        self.assertEqual(response.status_code, 200)
 
-            # Verify response
-            self.assertEqual(response.status_code, 200)
+        # Verify CSV log record was created with failure status
+        self.assertEqual(CsvLog.objects.count(), 1)
+        csv_log = CsvLog.objects.first()
+
+        # Verify log record fields
+        self.assertEqual(csv_log.process_type, CsvProcessType.UPLOAD)
+        self.assertEqual(csv_log.process_result, CsvProcessResult.FAILURE)
+        self.assertEqual(csv_log.app_name, "sfd")
+        self.assertEqual(csv_log.processed_by, self.user.username)
+        self.assertEqual(csv_log.ip_address, "192.168.1.100")
+        self.assertEqual(csv_log.file_name, "test.csv")
+        self.assertEqual(csv_log.total_line, 0)  # No lines processed due to early failure
+
+    @pytest.mark.django_db(databases=["default", "postgres"])
+    @patch.object(TestModelAdmin, "post_upload")
+    def test_upload_file_rolls_back_rows_on_failure(self, mock_post_upload):
+        """Test that rows inserted before a failure are rolled back while the failure CSV log is kept."""
+        from sfd.models.csv_log import CsvProcessResult
 
-            # Verify CSV log record was created with failure status
-            self.assertEqual(CsvLog.objects.count(), 1)
-            csv_log = CsvLog.objects.first()
+        self.model_admin.upload_column_names = ["name", "email"]
+        mock_post_upload.side_effect = ValueError("Test error")
+
+        request, storage = self._build_messaging_request(self._upload_post_data, {"upload_file": create_test_csv_file(CSV_BYTES)})
 
-            # Verify log record fields
-            self.assertEqual(csv_log.process_type, CsvProcessType.UPLOAD)
-            self.assertEqual(csv_log.process_result, CsvProcessResult.FAILURE)
-            self.assertEqual(csv_log.app_name, "sfd")
-            self.assertEqual(csv_log.processed_by, self.user.username)
-            self.assertEqual(csv_log.ip_address, "192.168.1.100")
-            self.assertEqual(csv_log.file_name, "test.csv")
-            self.assertEqual(csv_log.total_line, 0)  # No lines processed due to early failure
+        self.model_admin.upload_file(request)
+
+        self.assertEqual(TestModel.objects.count(), 0)
+        self.assertEqual(CsvLog.objects.get().process_result, CsvProcessResult.FAILURE)
 
     @pytest.mark.django_db(databases=["default", "postgres"])
     def test_pre_upload(self):
@@ -832,18 +838,13 @@ class UploadMixinTest(BaseTestMixin, TestCase):
     @patch("sfd.views.common.upload.settings.TEMP_DIR", tempfile.gettempdir())
     def test_zip_upload_extraction(self):
         """Test zip_upload method extracts CSV files correctly."""
-        import io
         import zipfile
 
-        # Create test CSV content
-        csv_content1 = "name,email\nTest1,test1@example.com"
-        csv_content2 = "name,email\nTest2,test2@example.com"
-
         # Create a zip file containing the CSV files
         zip_buffer = io.BytesIO()
         with zipfile.ZipFile(zip_buffer, "w", zipfile.ZIP_DEFLATED) as zf:
-            zf.writestr("test1.csv", csv_content1)
-            zf.writestr("test2.csv", csv_content2)
+            zf.writestr("test1.csv", CSV1_BYTES)
+            zf.writestr("test2.csv", CSV2_BYTES)
             zf.writestr("readme.txt", "This should be ignored")  # Non-CSV file
         zip_buffer.seek(0)
 
@@ -867,7 +868,6 @@ class UploadMixinTest(BaseTestMixin, TestCase):
 
     def test_zip_upload_no_csv_files(self):
         """Test zip_upload raises ValueError when no CSV files are found."""
-        import io
         import zipfile
 
         # Create a zip file with no CSV files
@@ -880,17 +880,15 @@ class UploadMixinTest(BaseTestMixin, TestCase):
         # Create SimpleUploadedFile from buffer
         zip_file = SimpleUploadedFile("test.zip", zip_buffer.read(), content_type="application/zip")
 
-        with translation.override("en"):
-            # Call zip_upload and expect ValueError
-            with self.assertRaises(ValueError) as context:
-                self.model_admin.zip_upload(zip_file, self.request)
+        # Call zip_upload and expect ValueError
+        with self.assertRaises(ValueError) as context:
+            self.model_admin.zip_upload(zip_file, self.request)
 
-            self.assertIn("No CSV files found", str(context.exception))
+        self.assertIn("No CSV files found", str(context.exception))
 
     @patch("sfd.views.common.upload.settings.TEMP_DIR", tempfile.gettempdir())
     def test_zip_upload_nested_directories(self):
         """Test zip_upload handles CSV files in nested directories."""
-        import io
         import zipfile
 
         # Create test CSV content
@@ -914,12 +912,32 @@ class UploadMixinTest(BaseTestMixin, TestCase):
         self.assertEqual(len(csv_files), 3, "Should extract all CSV files from nested directories")
         self.assertTrue(all(f.endswith(".csv") for f in csv_files), "All extracted files should be CSV files")
 
+    @patch("sfd.views.common.upload.settings.TEMP_DIR", tempfile.gettempdir())
+    def test_zip_upload_extracts_only_csv_members(self):
+        """Test zip_upload writes only CSV members to disk and skips macOS resource forks."""
+        import zipfile
+
+        zip_buffer = io.BytesIO()
+        with zipfile.ZipFile(zip_buffer, "w", zipfile.ZIP_DEFLATED) as zf:
+            zf.writestr("data/test1.CSV", CSV1_BYTES)
+            zf.writestr("data/readme.txt", "This should not be extracted")
+            zf.writestr("__MACOSX/data/._test1.CSV", b"resource fork")
+        zip_file = SimpleUploadedFile("members.zip", zip_buffer.getvalue(), content_type="application/zip")
+
+        csv_files = self.model_admin.zip_upload(zip_file, self.request)
+
+        self.assertEqual(len(csv_files), 1)
+        self.assertTrue(csv_files[0].endswith(os.path.join("data", "test1.CSV")))
+        extracted_dir = os.path.join(tempfile.gettempdir(), "zip_upload", "members.zip")
+        self.assertFalse(os.path.exists(os.path.join(extracted_dir, "data", "readme.txt")))
+        self.assertFalse(os.path.exists(os.path.join(extracted_dir, "__MACOSX")))
+
     def test_get_csv_reader(self):
         """Test get_csv_reader returns a CSV reader with correct encoding."""
         self.model_admin.upload_column_names = ["name", "email"]
 
         # Create test CSV content
-        csv_content = "name,email\nTest,test@example.com"
+        csv_content = b"name,email\nTest,test@example.com"
         csv_file = create_test_csv_file(csv_content)
 
         # Call get_csv_reader with correct parameter order: csv_file, encoding, request
@@ -929,6 +947,52 @@ class UploadMixinTest(BaseTestMixin, TestCase):
         self.assertEqual(len(rows), 1)
         self.assertEqual(rows[0], {"name": "Test", "email": "test@example.com"})
 
+    def test_get_csv_reader_streams_quoted_line_breaks(self):
+        """Test get_csv_reader parses the file as a stream, keeping line breaks inside quoted fields."""
+        self.model_admin.upload_column_names = ["name", "email"]
+        csv_file = create_test_csv_file(b'name,email\r\n"Multi\r\nLine",multi@example.com\r\n')
+
+        rows = list(self.model_admin.get_csv_reader(csv_file, Encoding.UTF8, self.request))
+
+        self.assertEqual(rows, [{"name": "Multi\r\nLine", "email": "multi@example.com"}])
+        self.assertFalse(csv_file.closed, "The uploaded file must stay open for the CSV log")
+
+    def test_get_csv_reader_row_shapes(self):
+        """Test get_csv_reader builds rows like csv.DictReader for blank, short and long lines."""
+        self.model_admin.upload_column_names = ["name", "email"]
+        csv_file = create_test_csv_file(b"name,email\n\nJohn Doe\nJane Smith,jane@example.com,extra\n")
+
+        rows = list(self.model_admin.get_csv_reader(csv_file, Encoding.UTF8, self.request))
+
+        self.assertEqual(
+            rows,
+            [
+                {"name": "John Doe", "email": None},
+                {"name": "Jane Smith", "email": "jane@example.com", None: ["extra"]},
+            ],
+        )
+
+    def test_get_csv_reader_skips_blank_lines_before_header(self):
+        """Test blank lines before the header are not counted as header lines, as with csv.DictReader."""
+        self.model_admin.upload_column_names = ["name", "email"]
+        csv_file = create_test_csv_file(b"\nname,email\nJohn Doe,john@example.com\n")
+
+        rows = list(self.model_admin.get_csv_reader(csv_file, Encoding.UTF8, self.request))
+
+        self.assertEqual(rows, [{"name": "John Doe", "email": "john@example.com"}])
+
+    def test_get_csv_reader_with_temporary_uploaded_file(self):
+        """Test get_csv_reader reads uploads spooled to disk from their temporary file path."""
+        self.model_admin.upload_column_names = ["name", "email"]
+
+        with TemporaryUploadedFile("test.csv", "text/csv", len(CSV_BYTES), "utf-8") as csv_file:
+            csv_file.write(CSV_BYTES)
+            csv_file.flush()
+
+            rows = list(self.model_admin.get_csv_reader(csv_file, Encoding.UTF8, self.request))
+
+        self.assertEqual(rows, [{"name": "John Doe", "email": "john@example.com"}])
+
     def test_get_csv_reader_with_file_path(self):
         """Test get_csv_reader with file path string instead of file object."""
         self.model_admin.upload_column_names = ["name", "email"]
@@ -964,7 +1028,7 @@ class UploadMixinTest(BaseTestMixin, TestCase):
         self.model_admin.upload_column_names = ["name", "email"]
 
         # Create CSV content
-        csv_content = "name,email\nAlice,alice@example.com\nBob,bob@example.com"
+        csv_content = b"name,email\nAlice,alice@example.com\nBob,bob@example.com"
         csv_file = create_test_csv_file(csv_content)
 
         # Call upload_data
@@ -988,7 +1052,7 @@ class UploadMixinTest(BaseTestMixin, TestCase):
         self.model_admin.upload_column_names = ["name", "email"]
 
         # Create CSV content with unique name field
-        csv_content = "name,email\nUniquePerson,unique@example.com"
+        csv_content = b"name,email\nUniquePerson,unique@example.com"
         csv_file = create_test_csv_file(csv_content)
 
         # Call upload_data
@@ -1011,7 +1075,7 @@ class UploadMixinTest(BaseTestMixin, TestCase):
         TestBaseModel.objects.create(name="ExistingPerson", email="old@example.com")
 
         # Create CSV content with same unique name but different email
-        csv_content = "name,email\nExistingPerson,new@example.com"
+        csv_content = b"name,email\nExistingPerson,new@example.com"
         csv_file = create_test_csv_file(csv_content)
 
         # Call upload_data
@@ -1023,6 +1087,24 @@ class UploadMixinTest(BaseTestMixin, TestCase):
         self.assertEqual(self.model_admin._bulk_update_list[0].email, "new@example.com")
         mock_process.assert_called_once()
 
+    @pytest.mark.django_db(databases=["default", "postgres"])
+    @patch.object(TestModelAdmin, "_process_bulk_operations")
+    def test_upload_data_with_unique_fields_update_and_insert(self, mock_process):
+        """Test upload_data sorts a chunk into updates of existing records and inserts of new unique values."""
+        self.model_admin.model = TestBaseModel
+        self.model_admin.upload_column_names = ["name", "email"]
+        self.model_admin.is_skip_existing = False
+        TestBaseModel.objects.create(name="ExistingPerson", email="old@example.com")
+
+        csv_content = b"name,email\nExistingPerson,new@example.com\nNewPerson,first@example.com\nNewPerson,second@example.com"
+        csv_file = create_test_csv_file(csv_content)
+
+        self.model_admin.upload_data(self.model_admin.get_csv_reader, csv_file, Encoding.UTF8, self.request)
+
+        self.assertEqual([(r.name, r.email) for r in self.model_admin._bulk_update_list], [("ExistingPerson", "new@example.com")])
+        self.assertEqual([(r.name, r.email) for r in self.model_admin._bulk_create_list], [("NewPerson", "first@example.com")])
+        mock_process.assert_called_once()
+
     @pytest.mark.django_db(databases=["default", "postgres"])
     @patch.object(TestModelAdmin, "_process_bulk_operations")
     def test_upload_data_skip_existing_records(self, mock_process):
@@ -1035,7 +1117,7 @@ class UploadMixinTest(BaseTestMixin, TestCase):
         TestBaseModel.objects.create(name="SkipPerson", email="skip@example.com")
 
         # Create CSV content with same unique name
-        csv_content = "name,email\nSkipPerson,newemail@example.com"
+        csv_content = b"name,email\nSkipPerson,newemail@example.com"
         csv_file = create_test_csv_file(csv_content)
 
         # Call upload_data
@@ -1044,6 +1126,41 @@ class UploadMixinTest(BaseTestMixin, TestCase):
         # Verify no records were added to either list
         self.assertEqual(len(self.model_admin._bulk_create_list), 0)
         self.assertEqual(len(self.model_admin._bulk_update_list), 0)
+        mock_process.assert_not_called()
+
+    @pytest.mark.django_db(databases=["default", "postgres"])
+    def test_upload_data_skip_existing_records_inserts_only_new(self):
+        """Test upload_data with is_skip_existing inserts new rows and leaves existing records untouched."""
+        self.model_admin.model = TestBaseModel
+        self.model_admin.upload_column_names = ["name", "email"]
+        self.model_admin.is_skip_existing = True
+        TestBaseModel.objects.create(name="SkipPerson", email="skip@example.com")
+
+        csv_content = b"name,email\nSkipPerson,newemail@example.com\nNewPerson,new@example.com\nNewPerson,again@example.com"
+        csv_file = create_test_csv_file(csv_content)
+
+        self.model_admin.upload_data(self.model_admin.get_csv_reader, csv_file, Encoding.UTF8, self.request)
+
+        self.assertEqual(self.model_admin._total_inserted, 1)
+        self.assertEqual(TestBaseModel.objects.count(), 2)
+        self.assertEqual(TestBaseModel.objects.get(name="SkipPerson").email, "skip@example.com")
+        self.assertEqual(TestBaseModel.objects.get(name="NewPerson").email, "new@example.com")
+
+    @pytest.mark.django_db(databases=["default", "postgres"])
+    def test_upload_data_skip_existing_conflict_is_not_counted(self):
+        """Test a row that still conflicts at insert time fails the upload instead of being dropped and counted as inserted."""
+        self.model_admin.model = TestBaseModel
+        self.model_admin.upload_column_names = ["name", "email"]
+        self.model_admin.is_skip_existing = True
+        TestBaseModel.objects.create(name="RacePerson", email="first@example.com")
+
+        csv_file = create_test_csv_file(b"name,email\nRacePerson,second@example.com")
+
+        # The row passes the existence check, as if RacePerson had been inserted concurrently after it
+        with patch.object(TestModelAdmin, "_get_existing_unique_keys", return_value=set()), self.assertRaises(IntegrityError):
+            self.model_admin.upload_data(self.model_admin.get_csv_reader, csv_file, Encoding.UTF8, self.request)
+
+        self.assertEqual(self.model_admin._total_inserted, 0)
 
     @pytest.mark.django_db(databases=["default", "postgres"])
     @patch.object(TestModelAdmin, "_process_bulk_operations")
@@ -1053,7 +1170,7 @@ class UploadMixinTest(BaseTestMixin, TestCase):
         self.model_admin.upload_column_names = ["name", "email"]
 
         # Create CSV content
-        csv_content = "name,email\nModelTest,model@example.com"
+        csv_content = b"name,email\nModelTest,model@example.com"
         csv_file = create_test_csv_file(csv_content)
 
         # Call upload_data
@@ -1073,8 +1190,8 @@ class UploadMixinTest(BaseTestMixin, TestCase):
         self.model_admin.chunk_size = 2  # Set small chunk size for testing
 
         # Create CSV with 5 records (will trigger chunking)
-        csv_content = "name,email\n"
-        csv_content += "\n".join([f"Person{i},person{i}@example.com" for i in range(5)])
+        csv_content = b"name,email\n"
+        csv_content += b"\n".join([f"Person{i},person{i}@example.com".encode() for i in range(5)])
         csv_file = create_test_csv_file(csv_content)
 
         # Call upload_data
@@ -1091,7 +1208,7 @@ class UploadMixinTest(BaseTestMixin, TestCase):
         self.model_admin.upload_column_names = ["name", "email"]
 
         # Create CSV with row that has empty values
-        csv_content = "name,email\nAlice,alice@example.com\n,\nBob,bob@example.com"
+        csv_content = b"name,email\nAlice,alice@example.com\n,\nBob,bob@example.com"
         csv_file = create_test_csv_file(csv_content)
 
         # Call upload_data
@@ -1111,7 +1228,7 @@ class UploadMixinTest(BaseTestMixin, TestCase):
         self.model_admin.upload_column_names = ["email"]  # Missing 'name' which is unique
 
         # Create CSV without unique field
-        csv_content = "email\nmissing@example.com"
+        csv_content = b"email\nmissing@example.com"
         csv_file = create_test_csv_file(csv_content)
 
         # Call upload_data and expect ValueError
@@ -1127,11 +1244,11 @@ class UploadMixinTest(BaseTestMixin, TestCase):
 
         # Mock convert2upload_fields to return empty dict
         with patch.object(self.model_admin, "convert2upload_fields", return_value={}):
-            csv_content = "name,email\nTest,test@example.com"
+            csv_content = b"name,email\nTest,test@example.com"
             csv_file = create_test_csv_file(csv_content)
 
             # Call upload_data and expect ValueError
-            with self.assertRaises(ValueError) as context, translation.override("en"):
+            with self.assertRaises(ValueError) as context:
                 self.model_admin.upload_data(self.model_admin.get_csv_reader, csv_file, Encoding.UTF8, self.request)
 
                 self.assertIn("No valid data found in the row", str(context.exception))
@@ -1144,7 +1261,7 @@ class UploadMixinTest(BaseTestMixin, TestCase):
         self.model_admin.upload_column_names = ["name", "email"]
 
         # Create CSV with duplicate unique name
-        csv_content = "name,email\nDuplicate,first@example.com\nDuplicate,second@example.com"
+        csv_content = b"name,email\nDuplicate,first@example.com\nDuplicate,second@example.com"
         csv_file = create_test_csv_file(csv_content)
 
         # Call upload_data
@@ -1154,6 +1271,7 @@ class UploadMixinTest(BaseTestMixin, TestCase):
         self.assertEqual(len(self.model_admin._bulk_create_list), 1)
         self.assertEqual(self.model_admin._bulk_create_list[0].name, "Duplicate")
         self.assertEqual(self.model_admin._bulk_create_list[0].email, "first@example.com")
+        self.assertEqual(self.model_admin._uploaded_unique_values, {("Duplicate",)})
 
     @pytest.mark.django_db(databases=["default", "postgres"])
     def test_process_bulk_operations_create_only(self):
@@ -1176,6 +1294,67 @@ class UploadMixinTest(BaseTestMixin, TestCase):
         self.assertEqual(len(self.model_admin._bulk_create_list), 0)  # List cleared
         self.assertEqual(TestModel.objects.count(), 2)
 
+    @pytest.mark.django_db(databases=["default", "postgres"])
+    @override_settings(SFD_UPLOAD_COPY_THRESHOLD=1)
+    def test_process_bulk_operations_copy_create(self):
+        """Test _process_bulk_operations inserts through COPY on PostgreSQL, keeping NULL and empty strings apart."""
+        if connection.vendor != "postgresql":
+            self.skipTest("COPY is only used on PostgreSQL")
+        self.model_admin.model = TestBaseModel
+        self.model_admin.upload_column_names = ["name", "email"]
+        upload_fields = self.model_admin.get_upload_db_fields(self.request)
+
+        self.model_admin._bulk_create_list = [
+            TestBaseModel(name="Person1", email="", created_by=None, is_active=False, date=date(2024, 1, 2)),
+            TestBaseModel(name='Person "2", quoted', email="person2@example.com", created_by="upload"),
+        ]
+
+        copy_results = []
+
+        def copy_spy(model_admin, *args):
+            copy_results.append(UploadMixin._copy_bulk_create(model_admin, *args))
+            return copy_results[-1]
+
+        with patch.object(TestModelAdmin, "_copy_bulk_create", autospec=True, side_effect=copy_spy):
+            self.model_admin._process_bulk_operations(upload_fields)
+
+        self.assertEqual(copy_results, [2])  # Inserted by COPY, not by the bulk_create fallback
+        self.assertEqual(self.model_admin._total_inserted, 2)
+        person1 = TestBaseModel.objects.get(name="Person1")
+        self.assertEqual(person1.email, "")
+        self.assertIsNone(person1.created_by)
+        self.assertFalse(person1.is_active)
+        self.assertEqual(person1.date, date(2024, 1, 2))
+        self.assertEqual(TestBaseModel.objects.get(name='Person "2", quoted').created_by, "upload")
+
+    def test_copy_bulk_create_disabled_by_default(self):
+        """Test COPY is not used unless SFD_UPLOAD_COPY_THRESHOLD is set."""
+        instances = [TestBaseModel(name=f"Person{i}") for i in range(3)]
+        for threshold in (0, None):
+            with self.subTest(threshold=threshold), override_settings(SFD_UPLOAD_COPY_THRESHOLD=threshold):
+                self.assertIsNone(self.model_admin._copy_bulk_create(TestBaseModel, instances, "postgres"))
+
+    def test_to_copy_value(self):
+        """Test _to_copy_value writes each supported type in a form PostgreSQL parses back, and rejects the rest."""
+        cases = [
+            (None, None),
+            ("", ""),
+            (True, "t"),
+            (False, "f"),
+            (12, "12"),
+            (Decimal("1.50"), "1.50"),
+            (date(2024, 1, 2), "2024-01-02"),
+            (datetime(2024, 1, 2, 3, 4, 5), "2024-01-02T03:04:05"),
+            (time(3, 4, 5), "03:04:05"),
+        ]
+        for value, expected in cases:
+            with self.subTest(value=value):
+                self.assertEqual(_to_copy_value(value), expected)
+
+        for value in (b"bytes", timedelta(hours=1), ["list"]):
+            with self.subTest(value=value), self.assertRaises(TypeError):
+                _to_copy_value(value)
+
     @pytest.mark.django_db(databases=["default", "postgres"])
     def test_process_bulk_operations_update_only(self):
         """Test _process_bulk_operations with only update operations."""
@@ -1344,9 +1523,25 @@ class UploadMixinTest(BaseTestMixin, TestCase):
         self.assertNotIn("email", result)
         self.assertNotIn("unknown", result)
 
+    def test_convert2upload_fields_resolves_field_types_once(self):
+        """Test convert2upload_fields dispatches on field types once per upload_fields mapping, not per row."""
+        mock_field = Mock()
+        mock_field.get_internal_type.return_value = "BooleanField"
+        upload_fields = {"is_active": mock_field}
+
+        for value, expected in (("yes", True), ("no", False), ("0", False)):
+            result = self.model_admin.convert2upload_fields({"is_active": value}, upload_fields, self.request)
+            self.assertEqual(result, {"is_active": expected})
+
+        mock_field.get_internal_type.assert_called_once()
+
+        # A new upload_fields mapping is resolved again
+        mock_field.get_internal_type.return_value = "CharField"
+        result = self.model_admin.convert2upload_fields({"is_active": "no"}, dict(upload_fields), self.request)
+        self.assertEqual(result, {"is_active": "no"})
+
     @pytest.mark.django_db(databases=["default", "postgres"])
-    @patch("sfd.views.common.upload.reverse", return_value="/admin/testmodel/upload/")
-    def test_changelist_view(self, mock_reverse):
+    def test_changelist_view(self):
         """Test changelist_view adds upload URL to context."""
         # Call changelist_view
         response = self.model_admin.changelist_view(self.request)
@@ -1362,17 +1557,10 @@ class UploadMixinTest(BaseTestMixin, TestCase):
         self.assertIn("upload_button_name", context)
         self.assertEqual(context["upload_url"], "/admin/testmodel/upload/")
 
-    @patch("sfd.views.common.upload.reverse", return_value="/admin/testmodel/upload/")
-    def test_upload_file_post_invalid_form(self, mock_reverse):
+    def test_upload_file_post_invalid_form(self):
         """Test upload_file with invalid POST request (no file)."""
         # Create POST request without file
-        request = self.factory.post("/admin/upload/", {"upload_type": UploadType.CSV, "encoding": Encoding.UTF8})
-        request.user = self.user
-
-        # Setup message storage
-        request.session = {}  # type: ignore[attr-defined]
-        storage = FallbackStorage(request)
-        request._messages = storage  # type: ignore[attr-defined]
+        request, storage = self._build_messaging_request(self._upload_post_data)
 
         # Test upload with invalid form (missing file)
         response = self.model_admin.upload_file(request)
@@ -1381,214 +1569,127 @@ class UploadMixinTest(BaseTestMixin, TestCase):
         self.assertEqual(response.status_code, 200)
 
     @pytest.mark.django_db(databases=["default", "postgres"])
-    @patch("sfd.views.common.upload.reverse", return_value="/admin/testmodel/upload/")
-    def test_upload_file_exception(self, mock_reverse):
+    def test_upload_file_exception(self):
         self.model_admin.upload_column_names = ["name", "email"]
 
         # Mock upload_data to raise an exception
         with patch.object(self.model_admin, "upload_data", side_effect=ValueError("Test debug error")):
-            csv_content = "name,email\nJohn,john@example.com"
-            csv_file = create_test_csv_file(csv_content)
+            csv_file = create_test_csv_file(CSV_BYTES)
 
             # Create POST request
-            request = self.factory.post("/admin/upload/", {"upload_type": UploadType.CSV, "encoding": Encoding.UTF8}, format="multipart")
-            request.FILES["upload_file"] = csv_file
-            request.user = self.user
-
-            # Setup message storage
-            request.session = {}  # type: ignore[attr-defined]
-            storage = FallbackStorage(request)
-            request._messages = storage  # type: ignore[attr-defined]
+            request, storage = self._build_messaging_request(self._upload_post_data, {"upload_file": csv_file})
 
-            with translation.override("en"):
-                # Test upload
-                response = self.model_admin.upload_file(request)
+            # Test upload
+            response = self.model_admin.upload_file(request)
 
-                # Verify response
-                self.assertEqual(response.status_code, 200)
+            # Verify response
+            self.assertEqual(response.status_code, 200)
 
-                # Verify error messages
-                messages = list(storage)
-                self.assertGreaterEqual(len(messages), 1)
-                self.assertIn("An unexpected error has occurred", str(messages[0]))
+            # Verify error messages
+            messages = storage._queued_messages
+            self.assertGreaterEqual(len(messages), 1)
+            self.assertIn("An unexpected error has occurred", str(messages[0]))
 
     @pytest.mark.django_db(databases=["default", "postgres"])
-    @patch("sfd.views.common.upload.reverse", return_value="/admin/testmodel/upload/")
-    def test_upload_file_exception_with_htmx_error(self, mock_reverse):
+    def test_upload_file_exception_with_htmx_error(self):
         """Test upload_file exception handling with HTMX request."""
         self.model_admin.upload_column_names = ["name", "email"]
 
         # Mock upload_data to raise an exception
         with patch.object(self.model_admin, "upload_data", side_effect=ValueError("Test HTMX error")):
-            csv_content = "name,email\nJohn,john@example.com"
-            csv_file = create_test_csv_file(csv_content)
+            csv_file = create_test_csv_file(CSV_BYTES)
 
             # Create HTMX POST request
-            request = self.factory.post("/admin/upload/", {"upload_type": UploadType.CSV, "encoding": Encoding.UTF8}, format="multipart")
-            request.FILES["upload_file"] = csv_file
-            request.user = self.user
+            request, storage = self._build_messaging_request(self._upload_post_data, {"upload_file": csv_file})
             request.headers = {"HX-Request": "true"}  # Mark as HTMX request
 
-            # Setup message storage
-            request.session = {}  # type: ignore[attr-defined]
-            storage = FallbackStorage(request)
-            request._messages = storage  # type: ignore[attr-defined]
-
-            with translation.override("en"):
-                # Test upload
-                response = self.model_admin.upload_file(request)
+            # Test upload
+            response = self.model_admin.upload_file(request)
 
-                # Verify response
-                self.assertEqual(response.status_code, 200)
-                self.assertEqual(response["HX-Trigger"], "uploadError")
+            # Verify response
+            self.assertEqual(response.status_code, 200)
+            self.assertEqual(response["HX-Trigger"], "uploadError")
 
-    def test_convert2upload_fields_datetime_field(self):
-        """Test convert2upload_fields with DateTimeField conversion."""
-        from datetime import datetime
+    def _assert_converted(self, internal_type, cases):
+        """Assert convert2upload_fields converts each (value, expected) case for a field of the given internal type."""
+        upload_fields = {"field": _field_mock(internal_type)}
 
-        # Mock a DateTimeField
-        mock_field = Mock()
-        mock_field.get_internal_type.return_value = "DateTimeField"
+        for value, expected in cases:
+            with self.subTest(value=value):
+                result = self.model_admin.convert2upload_fields({"field": value}, upload_fields, self.request)
+                self.assertEqual(result["field"], expected)
 
-        upload_fields = {"datetime_field": mock_field}
+    def _assert_conversion_errors(self, internal_type, values):
+        """Assert convert2upload_fields rejects each value for a field of the given internal type."""
+        upload_fields = {"field": _field_mock(internal_type)}
 
-        # Test with string datetime
-        row_dict = {"datetime_field": "2024-12-25 10:30:00"}
-        result = self.model_admin.convert2upload_fields(row_dict, upload_fields, self.request)
-        self.assertEqual(result["datetime_field"], datetime(2024, 12, 25, 10, 30, 0))
+        for value in values:
+            with self.subTest(value=value), self.assertRaises(ValueError) as context:
+                self.model_admin.convert2upload_fields({"field": value}, upload_fields, self.request)
+            self.assertIn("Invalid value", str(context.exception))
 
-        # Test with empty value
-        row_dict = {"datetime_field": ""}
-        result = self.model_admin.convert2upload_fields(row_dict, upload_fields, self.request)
-        self.assertIsNone(result["datetime_field"])
-
-        # Test with datetime object
+    def test_convert2upload_fields_datetime_field(self):
+        """Test convert2upload_fields with DateTimeField conversion."""
         dt = datetime(2024, 12, 25, 10, 30, 0)
-        row_dict = {"datetime_field": dt}
-        result = self.model_admin.convert2upload_fields(row_dict, upload_fields, self.request)
-        self.assertEqual(result["datetime_field"], dt)
-
-        # Test with various datetime formats
-        test_formats = [
-            ("2024-12-25 10:30", datetime(2024, 12, 25, 10, 30)),
-            ("2024-12-25 10:30:00.123456", datetime(2024, 12, 25, 10, 30, 0, 123456)),
-            ("2024-12-25", datetime(2024, 12, 25, 0, 0, 0)),
-        ]
-        for date_str, expected in test_formats:
-            row_dict = {"datetime_field": date_str}
-            result = self.model_admin.convert2upload_fields(row_dict, upload_fields, self.request)
-            self.assertEqual(result["datetime_field"], expected)
+        self._assert_converted(
+            "DateTimeField",
+            [
+                ("2024-12-25 10:30:00", datetime(2024, 12, 25, 10, 30, 0)),
+                ("", None),
+                (dt, dt),
+                ("2024-12-25 10:30", datetime(2024, 12, 25, 10, 30)),
+                ("2024-12-25 10:30:00.123456", datetime(2024, 12, 25, 10, 30, 0, 123456)),
+                ("2024-12-25", datetime(2024, 12, 25, 0, 0, 0)),
+            ],
+        )
 
     def test_convert2upload_fields_datetime_field_error(self):
         """Test convert2upload_fields raises error for invalid datetime."""
-        # Mock a DateTimeField
-        mock_field = Mock()
-        mock_field.get_internal_type.return_value = "DateTimeField"
-
-        upload_fields = {"datetime_field": mock_field}
-
-        # Test with invalid datetime string
-        row_dict = {"datetime_field": "invalid-datetime"}
-        with self.assertRaises(ValueError) as context:
-            self.model_admin.convert2upload_fields(row_dict, upload_fields, self.request)
-        self.assertIn("Invalid value", str(context.exception))
-
-        # Test with invalid type
-        row_dict = {"datetime_field": 12345}
-        with self.assertRaises(ValueError) as context:
-            self.model_admin.convert2upload_fields(row_dict, upload_fields, self.request)
-        self.assertIn("Invalid value", str(context.exception))
+        self._assert_conversion_errors("DateTimeField", ["invalid-datetime", 12345])
+
+    def test_convert2upload_fields_rejects_non_download_iso_shapes(self):
+        """Test ISO 8601 shapes that downloads never produce are still rejected, as strptime rejects them."""
+        cases = {
+            "DateField": ["20240101", "2024-W01-1", "2024-001", "2024-01-01T00:00"],
+            "DateTimeField": ["20240101T103000", "2024-01-01T10:30:00", "2024-W01-1 10:30", "2024-01-01 1030", "2024-01-01 10:30:00.123+09"],
+            "TimeField": ["10", "1030", "103000", "10:30:00+09:00", "10:30:00.5", "T10:30"],
+        }
+        for internal_type, values in cases.items():
+            with self.subTest(internal_type=internal_type):
+                self._assert_conversion_errors(internal_type, values)
 
     def test_convert2upload_fields_time_field(self):
         """Test convert2upload_fields with TimeField conversion."""
-        from datetime import time
-
-        # Mock a TimeField
-        mock_field = Mock()
-        mock_field.get_internal_type.return_value = "TimeField"
-
-        upload_fields = {"time_field": mock_field}
-
-        # Test with string time
-        row_dict = {"time_field": "10:30:45"}
-        result = self.model_admin.convert2upload_fields(row_dict, upload_fields, self.request)
-        self.assertEqual(result["time_field"], time(10, 30, 45))
-
-        # Test with empty value
-        row_dict = {"time_field": ""}
-        result = self.model_admin.convert2upload_fields(row_dict, upload_fields, self.request)
-        self.assertIsNone(result["time_field"])
-
-        # Test with time object
         t = time(10, 30, 45)
-        row_dict = {"time_field": t}
-        result = self.model_admin.convert2upload_fields(row_dict, upload_fields, self.request)
-        self.assertEqual(result["time_field"], t)
-
-        # Test with short format
-        row_dict = {"time_field": "10:30"}
-        result = self.model_admin.convert2upload_fields(row_dict, upload_fields, self.request)
-        self.assertEqual(result["time_field"], time(10, 30, 0))
+        self._assert_converted(
+            "TimeField",
+            [
+                ("10:30:45", time(10, 30, 45)),
+                ("", None),
+                (t, t),
+                ("10:30", time(10, 30, 0)),
+            ],
+        )
 
     def test_convert2upload_fields_time_field_error(self):
         """Test convert2upload_fields raises error for invalid time."""
-        # Mock a TimeField
-        mock_field = Mock()
-        mock_field.get_internal_type.return_value = "TimeField"
-
-        upload_fields = {"time_field": mock_field}
-
-        # Test with invalid time string
-        row_dict = {"time_field": "invalid-time"}
-        with self.assertRaises(ValueError) as context:
-            self.model_admin.convert2upload_fields(row_dict, upload_fields, self.request)
-        self.assertIn("Invalid value", str(context.exception))
-
-        # Test with invalid type
-        row_dict = {"time_field": 12345}
-        with self.assertRaises(ValueError) as context:
-            self.model_admin.convert2upload_fields(row_dict, upload_fields, self.request)
-        self.assertIn("Invalid value", str(context.exception))
+        self._assert_conversion_errors("TimeField", ["invalid-time", 12345])
 
     def test_convert2upload_fields_duration_field(self):
         """Test convert2upload_fields with DurationField conversion."""
-        from datetime import timedelta
-
-        # Mock a DurationField
-        mock_field = Mock()
-        mock_field.get_internal_type.return_value = "DurationField"
-
-        upload_fields = {"duration_field": mock_field}
-
-        # Test with string duration
-        row_dict = {"duration_field": "10:30:45"}
-        result = self.model_admin.convert2upload_fields(row_dict, upload_fields, self.request)
-        self.assertEqual(result["duration_field"], timedelta(hours=10, minutes=30, seconds=45))
-
-        # Test with empty value
-        row_dict = {"duration_field": ""}
-        result = self.model_admin.convert2upload_fields(row_dict, upload_fields, self.request)
-        self.assertIsNone(result["duration_field"])
-
-        # Test with timedelta object
         td = timedelta(hours=10, minutes=30, seconds=45)
-        row_dict = {"duration_field": td}
-        result = self.model_admin.convert2upload_fields(row_dict, upload_fields, self.request)
-        self.assertEqual(result["duration_field"], td)
+        self._assert_converted(
+            "DurationField",
+            [
+                ("10:30:45", timedelta(hours=10, minutes=30, seconds=45)),
+                ("", None),
+                (td, td),
+            ],
+        )
 
     def test_convert2upload_fields_duration_field_error(self):
         """Test convert2upload_fields raises error for invalid duration."""
-        # Mock a DurationField
-        mock_field = Mock()
-        mock_field.get_internal_type.return_value = "DurationField"
-
-        upload_fields = {"duration_field": mock_field}
-
-        # Test with invalid type
-        row_dict = {"duration_field": 12345}
-        with self.assertRaises(ValueError) as context:
-            self.model_admin.convert2upload_fields(row_dict, upload_fields, self.request)
-        self.assertIn("Invalid value", str(context.exception))
+        self._assert_conversion_errors("DurationField", [12345])
 
     def test_convert2upload_fields_boolean_field_none(self):
         """Test convert2upload_fields with BooleanField None value."""
@@ -1625,18 +1726,8 @@ class UploadMixinTest(BaseTestMixin, TestCase):
         """Test upload_data continues when row is empty."""
         self.model_admin.upload_column_names = ["name", "email"]
 
-        # Mock a CSV reader that returns None/empty rows
-        def mock_csv_reader(*args, **kwargs):
-            """Generator that yields empty and non-empty rows."""
-            yield None  # Empty row (should be skipped)
-            yield {"name": "Alice", "email": "alice@example.com"}
-            yield {}  # Empty dict (should be skipped)
-            yield {"name": "Bob", "email": "bob@example.com"}
-            yield False  # Falsy value (should be skipped)
-            yield {"name": "Charlie", "email": "charlie@example.com"}
-
-        # Call upload_data with mock reader
-        self.model_admin.upload_data(mock_csv_reader, None, Encoding.UTF8, self.request)
+        # Call upload_data with a reader over fixed rows, including empty and falsy ones
+        self.model_admin.upload_data(lambda *args, **kwargs: iter(EMPTY_AND_FILLED_ROWS), None, Encoding.UTF8, self.request)
 
         # Only non-empty rows should be processed (3 records)
         self.assertEqual(len(self.model_admin._bulk_create_list), 3)
@@ -1670,8 +1761,8 @@ class UploadMixinTest(BaseTestMixin, TestCase):
         record1.refresh_from_db()
         self.assertEqual(record1.email, "new1@example.com")
 
-    @patch("sfd.views.common.upload.reverse", return_value="/admin/testmodel/upload/")
-    def test_upload_file_with_upload_model_set(self, mock_reverse):
+    @pytest.mark.django_db(databases=["default", "postgres"])
+    def test_upload_file_with_upload_model_set(self):
         """Test upload_file uses upload_model verbose_name when upload_model is set."""
 
         # Define a dummy upload model
@@ -1689,14 +1780,7 @@ class UploadMixinTest(BaseTestMixin, TestCase):
             "upload_type": UploadType.CSV,
             "encoding": Encoding.UTF8,
         }
-        request = self.factory.post("/admin/upload/", data=data, format="multipart")
-        request.FILES["upload_file"] = uploaded_file
-        request.user = self.user
-
-        # Setup message storage for the request
-        request.session = {}  # type: ignore[attr-defined]
-        storage = FallbackStorage(request)
-        request._messages = storage  # type: ignore[attr-defined]
+        request, storage = self._build_messaging_request(data, {"upload_file": uploaded_file})
 
         # Mock methods to avoid DB operations on non-existent table
         self.model_admin.pre_upload = Mock()
@@ -1720,24 +1804,22 @@ class UploadMixinTest(BaseTestMixin, TestCase):
 class BaseModelUploadMixinTest(BaseTestMixin, TestCase):
     """Test BaseModelUploadMixin functionality with comprehensive coverage."""
 
-    databases = ["default", "postgres"]
+    @classmethod
+    def setUpClass(cls):
+        """Build the admin site and a prototype model admin once for the whole class."""
+        super().setUpClass()
+        cls.admin_site = AdminSite()
+        cls._model_admin_prototype = TestBaseModelAdmin(TestBaseModel, cls.admin_site)
 
     def setUp(self):
-        """Set up test environment with model admin instance."""
+        """Set up test environment with a fresh copy of the prototype model admin."""
         super().setUp()
-        self.admin_site = AdminSite()
-        self.model_admin = TestBaseModelAdmin(TestBaseModel, self.admin_site)
+        self.model_admin = copy.copy(self._model_admin_prototype)
+        _reset_upload_state(self.model_admin)
 
         self.request = self.factory.get("/admin/")
         self.request.user = self.user
 
-        self.model_admin._bulk_create_list = []
-        self.model_admin._bulk_update_list = []
-        self.model_admin._uploaded_unique_values = set()  # 今回アップロードしたCSVのユニーク値
-        self.model_admin._total_inserted = 0  # Track total inserted across chunks
-        self.model_admin._total_updated = 0  # Track total updated across chunks
-        self.model_admin._upload_datetime = timezone.now()
-
     def test_get_upload_column_names_includes_base_model_fields(self):
         """Test get_upload_column_names includes BaseModel fields at the end."""
         self.model_admin.upload_column_names = ["name", "email"]
@@ -1810,10 +1892,7 @@ class BaseModelUploadMixinTest(BaseTestMixin, TestCase):
 
     def test_convert2upload_fields_adds_updated_by(self):
         """Test convert2upload_fields adds updated_by from request user."""
-        self.model_admin.upload_column_names = ["name", "email"]
-        column_names = self.model_admin.get_upload_column_names(self.request)
-        self.model_admin.upload_column_names = column_names
-        upload_fields = self.model_admin.get_upload_db_fields(self.request)
+        upload_fields = _resolve_upload_fields(TestBaseModelAdmin, TestBaseModel, ("name", "email"))
 
         row_dict = {"name": "Test User", "email": "test@example.com"}
         result = self.model_admin.convert2upload_fields(row_dict, upload_fields, self.request)
@@ -1822,8 +1901,7 @@ class BaseModelUploadMixinTest(BaseTestMixin, TestCase):
 
     def test_convert2upload_fields_preserves_existing_created_by(self):
         """Test convert2upload_fields preserves existing created_by if present."""
-        self.model_admin.upload_column_names = ["name", "email", "created_by"]
-        upload_fields = self.model_admin.get_upload_db_fields(self.request)
+        upload_fields = _resolve_upload_fields(TestBaseModelAdmin, TestBaseModel, ("name", "email", "created_by"))
 
         row_dict = {"name": "Test User", "email": "test@example.com", "created_by": "original_user"}
         result = self.model_admin.convert2upload_fields(row_dict, upload_fields, self.request)
@@ -1833,8 +1911,7 @@ class BaseModelUploadMixinTest(BaseTestMixin, TestCase):
 
     def test_convert2upload_fields_overwrites_updated_by(self):
         """Test convert2upload_fields always overwrites updated_by with current user."""
-        self.model_admin.upload_column_names = ["name", "email", "updated_by"]
-        upload_fields = self.model_admin.get_upload_db_fields(self.request)
+        upload_fields = _resolve_upload_fields(TestBaseModelAdmin, TestBaseModel, ("name", "email", "updated_by"))
 
         row_dict = {"name": "Test User", "email": "test@example.com", "updated_by": "original_updater"}
         result = self.model_admin.convert2upload_fields(row_dict, upload_fields, self.request)
@@ -1844,10 +1921,7 @@ class BaseModelUploadMixinTest(BaseTestMixin, TestCase):
 
     def test_convert2upload_fields_handles_date_fields(self):
         """Test convert2upload_fields handles DateField conversion for BaseModel."""
-        self.model_admin.upload_column_names = ["name", "date"]
-        column_names = self.model_admin.get_upload_column_names(self.request)
-        self.model_admin.upload_column_names = column_names
-        upload_fields = self.model_admin.get_upload_db_fields(self.request)
+        upload_fields = _resolve_upload_fields(TestBaseModelAdmin, TestBaseModel, ("name", "date"))
 
         row_dict = {"name": "Test User", "date": "2024-12-25"}
         result = self.model_admin.convert2upload_fields(row_dict, upload_fields, self.request)
@@ -1858,10 +1932,7 @@ class BaseModelUploadMixinTest(BaseTestMixin, TestCase):
 
     def test_convert2upload_fields_handles_boolean_fields(self):
         """Test convert2upload_fields handles BooleanField conversion for BaseModel."""
-        self.model_admin.upload_column_names = ["name", "is_active"]
-        column_names = self.model_admin.get_upload_column_names(self.request)
-        self.model_admin.upload_column_names = column_names
-        upload_fields = self.model_admin.get_upload_db_fields(self.request)
+        upload_fields = _resolve_upload_fields(TestBaseModelAdmin, TestBaseModel, ("name", "is_active"))
 
         row_dict = {"name": "Test User", "is_active": "true"}
         result = self.model_admin.convert2upload_fields(row_dict, upload_fields, self.request)
@@ -1876,8 +1947,7 @@ class BaseModelUploadMixinTest(BaseTestMixin, TestCase):
         self.model_admin.upload_column_names = ["name", "email"]
 
         # Create test CSV
-        csv_content = "name,email\nJohn Doe,john@example.com"
-        csv_file = create_test_csv_file(csv_content)
+        csv_file = create_test_csv_file(CSV_BYTES)
 
         # Call upload_data
         self.model_admin.upload_data(self.model_admin.get_csv_reader, csv_file, Encoding.UTF8, self.request)
@@ -1928,24 +1998,22 @@ class BaseModelUploadMixinTest(BaseTestMixin, TestCase):
 class MasterModelUploadMixinTest(BaseTestMixin, TestCase):
     """Test UploadMixin functionality with comprehensive coverage."""
 
-    databases = ["default", "postgres"]
+    @classmethod
+    def setUpClass(cls):
+        """Build the admin site and a prototype model admin once for the whole class."""
+        super().setUpClass()
+        cls.admin_site = AdminSite()
+        cls._model_admin_prototype = TestMasterModelAdmin(TestMasterModel, cls.admin_site)
 
     def setUp(self):
-        """Set up test environment with model admin instance."""
+        """Set up test environment with a fresh copy of the prototype model admin."""
         super().setUp()
-        self.admin_site = AdminSite()
-        self.model_admin = TestMasterModelAdmin(TestMasterModel, self.admin_site)
+        self.model_admin = copy.copy(self._model_admin_prototype)
+        _reset_upload_state(self.model_admin)
 
         self.request = self.factory.get("/admin/")
         self.request.user = self.user
 
-        self.model_admin._bulk_create_list = []
-        self.model_admin._bulk_update_list = []
-        self.model_admin._uploaded_unique_values = set()  # 今回アップロードしたCSVのユニーク値
-        self.model_admin._total_inserted = 0  # Track total inserted across chunks
-        self.model_admin._total_updated = 0  # Track total updated across chunks
-        self.model_admin._upload_datetime = timezone.now()
-
     def test_get_upload_db_fields(self):
         """Test get_upload_db_fields returns correct field mapping for MasterModel."""
         # Set upload_model to get all fields including valid_from and valid_to
@@ -2074,14 +2142,47 @@ class MasterModelUploadMixinTest(BaseTestMixin, TestCase):
         self.assertIn("name", result)
         self.assertIn("email", result)
 
+    @pytest.mark.django_db(databases=["default", "postgres"])
+    def test_get_existing_unique_keys_matches_full_composite_key(self):
+        """Test existing records are selected on every unique field, not only on the first one."""
+        unique_db_fields = [TestMasterModel._meta.get_field(name) for name in ("name", "valid_from")]
+        TestMasterModel.objects.bulk_create(
+            [
+                TestMasterModel(name="Master1", valid_from=date(2024, 1, 1)),
+                TestMasterModel(name="Master1", valid_from=date(2024, 4, 1)),
+                TestMasterModel(name="Master2", valid_from=date(2024, 1, 1)),
+            ]
+        )
+        unique_keys = {("Master1", date(2024, 1, 1)), ("Master2", date(2024, 4, 1)), ("Master3", date(2024, 1, 1))}
+
+        querysets = self.model_admin._get_existing_querysets(unique_keys, unique_db_fields)
+
+        self.assertEqual([(obj.name, obj.valid_from) for queryset in querysets for obj in queryset], [("Master1", date(2024, 1, 1))])
+        self.assertEqual(self.model_admin._get_existing_unique_keys(unique_keys, unique_db_fields), {("Master1", date(2024, 1, 1))})
+        self.assertEqual(list(self.model_admin._get_existing_records(unique_keys, unique_db_fields)), [("Master1", date(2024, 1, 1))])
+
+    @pytest.mark.django_db(databases=["default", "postgres"])
+    def test_get_existing_querysets_batches_by_parameter_limit(self):
+        """Test composite keys are split so each query stays within the backend's parameter limit."""
+        unique_db_fields = [TestMasterModel._meta.get_field(name) for name in ("name", "valid_from")]
+        unique_keys = {(f"Master{i}", date(2024, 1, 1)) for i in range(5)}
+        features = SimpleNamespace(max_query_params=4)
+
+        with (
+            patch("sfd.views.common.upload.connections", {"default": SimpleNamespace(features=features)}),
+            patch("sfd.views.common.upload.router.db_for_read", return_value="default"),
+        ):
+            querysets = self.model_admin._get_existing_querysets(unique_keys, unique_db_fields)
+
+        # At most 2 keys of 2 fields per query
+        self.assertEqual([len(queryset.query.sql_with_params()[1]) for queryset in querysets], [4, 4, 2])
+
 
 @pytest.mark.unit
 @pytest.mark.upload
 class UploadEncryptedFieldsTest(BaseTestMixin, TestCase):
     """Test upload handling of encrypted fields."""
 
-    databases = {"default", "postgres"}
-
     def setUp(self):
         """Set up test fixtures."""
         super().setUp()
@@ -2204,3 +2305,13 @@ class UploadEncryptedFieldsTest(BaseTestMixin, TestCase):
 
         # The value should be preserved exactly as-is
         self.assertEqual(result["notes"], special_text)
+
+    def test_normalize_unique_key_keeps_encrypted_values(self):
+        """Test encrypted unique fields are compared on the plain value without running their to_python."""
+        name_field = TestEncryptedModel._meta.get_field("name")
+
+        with patch.object(type(name_field), "to_python") as mock_to_python:
+            result = self.model_admin._normalize_unique_key(["Secret Name"], [name_field])
+
+        self.assertEqual(result, ("Secret Name",))
+        mock_to_python.assert_not_called()
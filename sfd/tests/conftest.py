@@ -0,0 +1,43 @@
+"""
+Pytest configuration for SFD application tests.
+
+This module holds session-wide pytest-django overrides shared by every
+test module under ``sfd/tests``.
+"""
+
+import pytest
+
+
+@pytest.fixture(scope="session")
+def django_db_use_migrations():
+    """
+    Always build the test database schema without running migrations.
+
+    pytest-django disables migrations only when ``--nomigrations`` is passed.
+    Forcing it here keeps ad-hoc runs (e.g. ``pytest -o addopts=""``) from
+    replaying every migration on the ``default`` and ``postgres`` aliases;
+    the schema is created directly from the current models instead.
+
+    Returns:
+        bool: Always False so that ``MIGRATION_MODULES`` is disabled
+    """
+    return False
+
+
+@pytest.fixture(scope="session", autouse=True)
+def django_password_hasher():
+    """
+    Hash test passwords with the fast MD5 hasher for the whole session.
+
+    The default PBKDF2 hasher runs hundreds of thousands of iterations on
+    every ``create_user(password=...)``, ``set_password`` and
+    ``client.login`` call. Test passwords need no protection, so the
+    override keeps user fixtures and upload tests that set passwords cheap.
+
+    Yields:
+        None: The override stays active until the session ends
+    """
+    from django.test import override_settings
+
+    with override_settings(PASSWORD_HASHERS=["django.contrib.auth.hashers.MD5PasswordHasher"]):
+        yield
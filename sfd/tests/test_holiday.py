@@ -1,21 +1,21 @@
 # type: ignore
 """Test cases for sfd.models package."""
 
+import os
 from datetime import date
 
 import pytest
 from django.contrib.admin import AdminSite
 from django.db import IntegrityError
 from django.db.models import QuerySet
-from django.test import TestCase
+from django.test import TestCase, override_settings
 from django.utils import timezone
 from django.utils.translation import gettext_lazy as _
 
 from sfd.models import BaseModel, Holiday, HolidayType
 from sfd.tests.unittest import BaseTestMixin
 from sfd.views.base import BaseModelAdmin
-from sfd.views.common.pdf import BasePdfMixin
-from sfd.views.holiday import HolidayAdmin
+from sfd.views.holiday import HolidayAdmin, _cached_recent_years
 
 
 @pytest.mark.unit
@@ -43,15 +43,16 @@ class HolidayModelTest(TestCase):
 
     databases = {"default", "postgres"}
 
-    def setUp(self):
-        """Set up test environment with sample holiday data."""
-        self.holiday_date = date(2024, 1, 1)
-        self.holiday_data = {
-            "date": self.holiday_date,
+    @classmethod
+    def setUpTestData(cls):
+        """Create the sample holiday once for the whole class."""
+        cls.holiday_date = date(2024, 1, 1)
+        cls.holiday_data = {
+            "date": cls.holiday_date,
             "holiday_type": HolidayType.NATIONAL_HOLIDAY,
             "name": "New Year's Day",
         }
-        self.holiday = Holiday.objects.create(**self.holiday_data)
+        cls.holiday = Holiday.objects.create(**cls.holiday_data)
 
     def test_holiday_model_inherits_base_model(self):
         """Test that Holiday model inherits from BaseModel."""
@@ -101,18 +102,30 @@ class FilterYearTest(BaseTestMixin, TestCase):
 
     databases = {"default", "postgres"}
 
+    @classmethod
+    def setUpClass(cls):
+        """Build the admin site once for the whole class."""
+        super().setUpClass()
+        cls.site = AdminSite()
+
+    @classmethod
+    def setUpTestData(cls):
+        """Create the holidays shared by every test in a single INSERT."""
+        Holiday.objects.bulk_create(
+            [
+                Holiday(date=date(2023, 1, 1), holiday_type=HolidayType.NATIONAL_HOLIDAY),
+                Holiday(date=date(2024, 1, 1), holiday_type=HolidayType.NATIONAL_HOLIDAY),
+                Holiday(date=date(2025, 1, 1), holiday_type=HolidayType.NATIONAL_HOLIDAY),
+            ]
+        )
+
     def setUp(self):
         """Set up test data for HolidayAdmin tests."""
         super().setUp()
-        self.site = AdminSite()
         self.admin = HolidayAdmin(Holiday, self.site)
         self.request = self.factory.get("/admin/")
         self.request.user = self.user
 
-        Holiday.objects.create(date="2023-01-01", holiday_type=HolidayType.NATIONAL_HOLIDAY)
-        Holiday.objects.create(date="2024-01-01", holiday_type=HolidayType.NATIONAL_HOLIDAY)
-        Holiday.objects.create(date="2025-01-01", holiday_type=HolidayType.NATIONAL_HOLIDAY)
-
     def test_lookups(self):
         """Test lookups method returns correct year choices."""
         # Arrange - Get the filter class from list_filter
@@ -131,6 +144,32 @@ class FilterYearTest(BaseTestMixin, TestCase):
             self.assertIsInstance(year[0], int)
             self.assertIsInstance(year[1], str)
 
+    @override_settings(SFD_CACHE_HOLIDAY_YEARS=True)
+    def test_lookups_cached_until_holiday_saved(self):
+        """Test lookups reuses memoized years until a holiday is saved."""
+        # Arrange
+        _cached_recent_years.cache_clear()
+        self.addCleanup(_cached_recent_years.cache_clear)
+        filter_class = self.admin.list_filter[0]
+        filter_instance = filter_class(self.request, {}, Holiday, self.admin)
+        years = filter_instance.lookups(self.request, self.admin)
+
+        # Act & Assert - the second call is served without a query
+        with self.assertNumQueries(0, using="postgres"):
+            self.assertEqual(filter_instance.lookups(self.request, self.admin), years)
+
+        # Act & Assert - a committed save clears the cache
+        with self.captureOnCommitCallbacks(execute=True, using="postgres"):
+            Holiday.objects.create(date=date(2030, 1, 1), holiday_type=HolidayType.NATIONAL_HOLIDAY)
+        self.assertEqual(filter_instance.lookups(self.request, self.admin)[0], (2030, "2030"))
+
+    def test_holiday_save_skips_cache_clear_when_disabled(self):
+        """Test saving a holiday schedules no cache clear while SFD_CACHE_HOLIDAY_YEARS is off."""
+        with self.captureOnCommitCallbacks(using="postgres") as callbacks:
+            Holiday.objects.create(date=date(2030, 1, 1), holiday_type=HolidayType.NATIONAL_HOLIDAY)
+
+        self.assertEqual(callbacks, [])
+
     def test_queryset_without_value(self):
         """Test queryset method returns correct queryset."""
         # Arrange - Get the filter class from list_filter
@@ -170,21 +209,33 @@ class HolidayAdminTest(BaseTestMixin, TestCase):
 
     databases = {"default", "postgres"}
 
+    @classmethod
+    def setUpClass(cls):
+        """Build the admin site once for the whole class."""
+        super().setUpClass()
+        cls.site = AdminSite()
+
+    @classmethod
+    def setUpTestData(cls):
+        """Create the holidays shared by every test in a single INSERT."""
+        # Create holiday for current year to match test expectations
+        current_year = timezone.now().year
+        Holiday.objects.bulk_create(
+            [
+                Holiday(date=date(current_year, 2, 1), name="Test", holiday_type=HolidayType.NATIONAL_HOLIDAY),
+                Holiday(date=date(current_year, 1, 1), name="New Year", holiday_type=HolidayType.NATIONAL_HOLIDAY),
+                Holiday(date=date(2024, 1, 1), name="New Year", holiday_type=HolidayType.NATIONAL_HOLIDAY),
+                Holiday(date=date(2023, 1, 1), name="New Year", holiday_type=HolidayType.NATIONAL_HOLIDAY),
+            ]
+        )
+
     def setUp(self):
         """Set up test data for HolidayAdmin tests."""
         super().setUp()
-        self.site = AdminSite()
         self.admin = HolidayAdmin(Holiday, self.site)
         self.request = self.factory.get("/admin/")
         self.request.user = self.user
 
-        # Create holiday for current year to match test expectations
-        current_year = timezone.now().year
-        Holiday.objects.create(date=f"{current_year}-02-01", name="Test", holiday_type=HolidayType.NATIONAL_HOLIDAY)
-        Holiday.objects.create(date=f"{current_year}-01-01", name="New Year", holiday_type=HolidayType.NATIONAL_HOLIDAY)
-        Holiday.objects.create(date="2024-01-01", name="New Year", holiday_type=HolidayType.NATIONAL_HOLIDAY)
-        Holiday.objects.create(date="2023-01-01", name="New Year", holiday_type=HolidayType.NATIONAL_HOLIDAY)
-
     def test_admin_initialization(self):
         """Test HolidayAdmin initialization and field configuration."""
         # Assert
@@ -193,6 +244,8 @@ class HolidayAdminTest(BaseTestMixin, TestCase):
 
     def test_admin_inheritance(self):
         """Test that HolidayAdmin properly inherits from BaseModelAdmin."""
+        from sfd.views.common.pdf import BasePdfMixin
+
         # Assert
         self.assertTrue(isinstance(self.admin, BasePdfMixin))
         self.assertTrue(isinstance(self.admin, BaseModelAdmin))
@@ -244,6 +297,8 @@ class HolidayAdminTest(BaseTestMixin, TestCase):
         self.assertEqual(_("year, name"), field_names)
 
     @pytest.mark.integration
+    @pytest.mark.pdf
+    @pytest.mark.skipif(not os.getenv("RUN_PDF_TESTS"), reason="renders real PDF files; set RUN_PDF_TESTS=1 to run")
     def test_create_pdf_files(self):
         """Test create_pdf_files method generates PDF files correctly."""
         # Act
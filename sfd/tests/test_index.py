@@ -1,16 +1,5 @@
-import os
 from unittest.mock import patch
 
-# Configure Django settings before importing Django components
-os.environ.setdefault("DJANGO_SETTINGS_MODULE", "sfd_prj.settings")
-
-import django
-from django.conf import settings
-
-# Setup Django if not already done
-if not settings.configured:
-    django.setup()
-
 import pytest
 from django.contrib.auth.models import AnonymousUser, User
 from django.test import RequestFactory, TestCase
@@ -27,10 +16,14 @@ class IndexViewTest(BaseTestMixin, TestCase):
 
     databases = {"default", "postgres"}
 
+    @classmethod
+    def setUpTestData(cls):
+        """Create the test user once for the whole class."""
+        cls.user = User.objects.create_user(username="testuser", password="testpass123")
+
     def setUp(self):
         """Set up test data for IndexView tests."""
         self.factory = RequestFactory()
-        self.user = User.objects.create_user(username="testuser", password="testpass123")
 
     def test_index_view_requires_authentication(self):
         """Test that IndexView requires user authentication."""
@@ -99,7 +92,7 @@ class IndexViewTest(BaseTestMixin, TestCase):
     def test_index_view_full_request_cycle(self):
         """Test full request cycle for authenticated user."""
         # Arrange
-        self.client.login(username="testuser", password="testpass123")
+        self.client.force_login(self.user)
 
         # Act - Test the root URL redirect behavior
         response = self.client.get("/")
@@ -114,7 +107,7 @@ class IndexViewTest(BaseTestMixin, TestCase):
         # Arrange
         from django.test import override_settings
 
-        self.client.login(username="testuser", password="testpass123")
+        self.client.force_login(self.user)
 
         # Act - Test direct access to IndexView (if it were properly mapped)
         # Note: Since sfd.urls is not included in main URLs, we test the view directly
@@ -1,9 +1,13 @@
 # type: ignore
+import functools
 import io
+import os
+import zipfile
 from datetime import date
+from string import ascii_uppercase
 from unittest.mock import Mock, patch
+from xml.sax.saxutils import escape
 
-import pandas as pd
 import pytest
 from django.contrib.admin import AdminSite
 from django.db import IntegrityError
@@ -16,6 +20,85 @@ from sfd.tests.unittest import BaseTestMixin
 from sfd.views.base import MasterModelAdmin
 from sfd.views.municipality import MunicipalityAdmin, get_municipalities_by_prefecture
 
+# Rows of the sheet_reader workbook fixture
+SHEET_READER_DATA = {
+    "Code": ["131010", "1230", "1234560", 456780],  # Covers string, short int, long int
+    "Prefecture": ["Tokyo", "Chiba", "Kanagawa", "Saitama"],
+    "Municipality": ["Chiyoda", "Chiba City", "Yokohama", "Saitama City"],
+    "Prefecture Kana": ["TOKYO", "CHIBA", "KANAGAWA", None],  # Test a null value
+    "Municipality Kana": ["CHIYODA", "CHIBA SHI", "YOKOHAMA", "SAITAMA SHI"],
+}
+
+
+# Parts of a minimal single-sheet .xlsx package; only the worksheet XML varies
+_XLSX_CONTENT_TYPES = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+    '<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">'
+    '<Default Extension="rels" ContentType="application/vnd.openxmlformats-package.relationships+xml"/>'
+    '<Default Extension="xml" ContentType="application/xml"/>'
+    '<Override PartName="/xl/workbook.xml" ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet.main+xml"/>'
+    '<Override PartName="/xl/worksheets/sheet1.xml" ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.worksheet+xml"/>'
+    "</Types>"
+)
+_XLSX_ROOT_RELS = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+    '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+    '<Relationship Id="rId1" Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/officeDocument" Target="xl/workbook.xml"/>'
+    "</Relationships>"
+)
+_XLSX_WORKBOOK = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+    '<workbook xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main" '
+    'xmlns:r="http://schemas.openxmlformats.org/officeDocument/2006/relationships">'
+    '<sheets><sheet name="{sheet_name}" sheetId="1" r:id="rId1"/></sheets>'
+    "</workbook>"
+)
+_XLSX_WORKBOOK_RELS = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+    '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+    '<Relationship Id="rId1" Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/worksheet" Target="worksheets/sheet1.xml"/>'
+    "</Relationships>"
+)
+_XLSX_SHEET = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+    '<worksheet xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main"><sheetData>{rows}</sheetData></worksheet>'
+)
+
+
+def make_xlsx(sheet_name, rows):
+    """Build the bytes of a one-sheet .xlsx workbook from rows of cell values, without pandas or openpyxl.
+
+    Numbers are written as numeric cells, strings as inline strings, and None leaves the cell empty.
+    """
+    sheet_rows = []
+    for row_number, row in enumerate(rows, start=1):
+        cells = []
+        for column, value in zip(ascii_uppercase, row, strict=False):
+            ref = f"{column}{row_number}"
+            if value is None:
+                continue
+            if isinstance(value, int | float):
+                cells.append(f'<c r="{ref}"><v>{value}</v></c>')
+            else:
+                cells.append(f'<c r="{ref}" t="inlineStr"><is><t>{escape(value)}</t></is></c>')
+        sheet_rows.append(f'<row r="{row_number}">{"".join(cells)}</row>')
+
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, "w", zipfile.ZIP_DEFLATED) as xlsx:
+        xlsx.writestr("[Content_Types].xml", _XLSX_CONTENT_TYPES)
+        xlsx.writestr("_rels/.rels", _XLSX_ROOT_RELS)
+        xlsx.writestr("xl/workbook.xml", _XLSX_WORKBOOK.format(sheet_name=escape(sheet_name, {'"': "&quot;"})))
+        xlsx.writestr("xl/_rels/workbook.xml.rels", _XLSX_WORKBOOK_RELS)
+        xlsx.writestr("xl/worksheets/sheet1.xml", _XLSX_SHEET.format(rows="".join(sheet_rows)))
+    return buffer.getvalue()
+
+
+@functools.cache
+def _sheet_reader_excel_bytes():
+    """Return SHEET_READER_DATA as the raw bytes of an .xlsx file, built once per session."""
+    rows = [list(SHEET_READER_DATA), *zip(*SHEET_READER_DATA.values(), strict=True)]
+    return make_xlsx("TestSheet", rows)
+
 
 @pytest.mark.unit
 @pytest.mark.models
@@ -24,9 +107,10 @@ class MunicipalityModelTest(TestCase):
 
     databases = {"default", "postgres"}
 
-    def setUp(self):
-        """Set up test environment with sample municipality data."""
-        self.municipality_data = {
+    @classmethod
+    def setUpTestData(cls):
+        """Set up the sample municipality data once for the whole class."""
+        cls.municipality_data = {
             "municipality_code": "131016",
             "municipality_name": "世田谷区",
             "municipality_name_kana": "セタガヤク",
@@ -104,6 +188,28 @@ class FilterPrefectureTest(BaseTestMixin, TestCase):
 
     databases = {"default", "postgres"}
 
+    @classmethod
+    def setUpTestData(cls):
+        """Create the municipalities shared by every test in a single INSERT."""
+        cls.hokkaido, cls.test_pref = Municipality.objects.bulk_create(
+            [
+                Municipality(
+                    municipality_code="01001",
+                    municipality_name="",
+                    municipality_name_kana="",
+                    prefecture_name="北海道",
+                    prefecture_name_kana="ホッカイドウ",
+                ),
+                Municipality(
+                    municipality_code="01901",
+                    municipality_name="",
+                    municipality_name_kana="",
+                    prefecture_name="テスト県",
+                    prefecture_name_kana="テストケン",
+                ),
+            ]
+        )
+
     def setUp(self):
         """Set up test data for MunicipalityAdmin tests."""
         super().setUp()
@@ -112,21 +218,6 @@ class FilterPrefectureTest(BaseTestMixin, TestCase):
         self.request = self.factory.get("/admin/")
         self.request.user = self.user
 
-        self.municipality = Municipality.objects.create(
-            municipality_code="01001",
-            municipality_name="",
-            municipality_name_kana="",
-            prefecture_name="北海道",
-            prefecture_name_kana="ホッカイドウ",
-        )
-        self.municipality = Municipality.objects.create(
-            municipality_code="01901",
-            municipality_name="",
-            municipality_name_kana="",
-            prefecture_name="テスト県",
-            prefecture_name_kana="テストケン",
-        )
-
     def test_lookups(self):
         """Test lookups method returns correct year choices."""
         # Arrange - Get the filter class from list_filter
@@ -183,6 +274,42 @@ class MunicipalityAdminTest(BaseTestMixin, TestCase):
 
     databases = {"default", "postgres"}
 
+    @classmethod
+    def setUpTestData(cls):
+        """Create the municipalities shared by every test in a single INSERT."""
+        Municipality.objects.bulk_create(
+            [
+                Municipality(
+                    municipality_code="01000",
+                    municipality_name="",
+                    municipality_name_kana="",
+                    prefecture_name="北海道",
+                    prefecture_name_kana="ホッカイドウ",
+                ),
+                Municipality(
+                    municipality_code="01001",
+                    municipality_name="札幌市",
+                    municipality_name_kana="サッポロシ",
+                    prefecture_name="北海道",
+                    prefecture_name_kana="ホッカイドウ",
+                ),
+                Municipality(
+                    municipality_code="09001",
+                    municipality_name="",
+                    municipality_name_kana="",
+                    prefecture_name="テスト県",
+                    prefecture_name_kana="テストケン",
+                ),
+                Municipality(
+                    municipality_code="09901",
+                    municipality_name="テスト市",
+                    municipality_name_kana="テストシ",
+                    prefecture_name="テスト県",
+                    prefecture_name_kana="テストケン",
+                ),
+            ]
+        )
+
     def setUp(self):
         """Set up test data for MunicipalityAdmin tests."""
         super().setUp()
@@ -192,35 +319,6 @@ class MunicipalityAdminTest(BaseTestMixin, TestCase):
         self.request = self.factory.get("/admin/")
         self.request.user = self.user
 
-        Municipality.objects.create(
-            municipality_code="01000",
-            municipality_name="",
-            municipality_name_kana="",
-            prefecture_name="北海道",
-            prefecture_name_kana="ホッカイドウ",
-        )
-        Municipality.objects.create(
-            municipality_code="01001",
-            municipality_name="札幌市",
-            municipality_name_kana="サッポロシ",
-            prefecture_name="北海道",
-            prefecture_name_kana="ホッカイドウ",
-        )
-        Municipality.objects.create(
-            municipality_code="09001",
-            municipality_name="",
-            municipality_name_kana="",
-            prefecture_name="テスト県",
-            prefecture_name_kana="テストケン",
-        )
-        Municipality.objects.create(
-            municipality_code="09901",
-            municipality_name="テスト市",
-            municipality_name_kana="テストシ",
-            prefecture_name="テスト県",
-            prefecture_name_kana="テストケン",
-        )
-
     def test_admin_inheritance(self):
         """Test that MunicipalityAdmin properly inherits from BaseModelAdmin."""
         # Assert
@@ -233,22 +331,8 @@ class MunicipalityAdminTest(BaseTestMixin, TestCase):
 
     def test_sheet_reader(self):
         """Test sheet_reader method handles file uploads correctly."""
-        sample_data = {
-            "Code": ["131010", "1230", "1234560", 456780],  # Covers string, short int, long int
-            "Prefecture": ["Tokyo", "Chiba", "Kanagawa", "Saitama"],
-            "Municipality": ["Chiyoda", "Chiba City", "Yokohama", "Saitama City"],
-            "Prefecture Kana": ["TOKYO", "CHIBA", "KANAGAWA", None],  # Test a null value
-            "Municipality Kana": ["CHIYODA", "CHIBA SHI", "YOKOHAMA", "SAITAMA SHI"],
-        }
-
-        df = pd.DataFrame(sample_data)
-        output_buffer = io.BytesIO()
-        with pd.ExcelWriter(output_buffer, engine="openpyxl") as writer:
-            df.to_excel(writer, sheet_name="TestSheet", index=False)
-
-        # The buffer now contains the raw bytes of an Excel file.
-        # We need to reset its "cursor" to the beginning to be read.
-        output_buffer.seek(0)
+        # A fresh buffer over the cached workbook bytes starts at position 0
+        output_buffer = io.BytesIO(_sheet_reader_excel_bytes())
         results = list(self.admin.sheet_reader(output_buffer, "TestSheet", self.request))
 
         self.assertEqual(len(results), 4)
@@ -288,7 +372,23 @@ class MunicipalityAdminTest(BaseTestMixin, TestCase):
         # Assert
         self.assertEqual(mock_upload_data.call_count, 2)
 
+    @patch.object(MunicipalityAdmin, "create_pdf_file", side_effect=lambda prefecture_name, pdf_data: f"{prefecture_name}.pdf")
+    def test_create_pdf_files_per_prefecture(self, mock_create_pdf_file):
+        """Test create_pdf_files renders one PDF per prefecture row without running ReportLab."""
+        # Act
+        pdf_files = self.admin.create_pdf_files(self.request, Municipality.objects.all())
+
+        # Assert - prefecture rows (empty municipality_name) in municipality_code order
+        self.assertEqual(pdf_files, ["北海道.pdf", "テスト県.pdf"])
+        self.assertEqual([call.args[0] for call in mock_create_pdf_file.call_args_list], ["北海道", "テスト県"])
+        self.assertEqual(
+            [[m.municipality_code for m in call.args[1]] for call in mock_create_pdf_file.call_args_list],
+            [["01000", "01001"], ["09001", "09901"]],
+        )
+
     @pytest.mark.integration
+    @pytest.mark.pdf
+    @pytest.mark.skipif(not os.getenv("RUN_PDF_TESTS"), reason="renders real PDF files; set RUN_PDF_TESTS=1 to run")
     def test_create_pdf_files(self):
         """Test create_pdf_files method generates PDF files correctly."""
 
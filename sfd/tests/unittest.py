@@ -8,6 +8,7 @@ for unit and integration tests across the SFD application.
 from unittest.mock import Mock
 
 from django.contrib.auth.models import AnonymousUser
+from django.contrib.messages.storage.fallback import FallbackStorage
 from django.db import models
 from django.test import RequestFactory
 
@@ -140,6 +141,26 @@ class BaseTestMixin:
 
         return request
 
+    def create_messaging_request(self, path="/", data=None, user=None):
+        """
+        Create a POST request with a session and message storage attached.
+
+        Args:
+            path (str): Request path
+            data (dict): POST data
+            user: User object to attach to request (defaults to self.user)
+
+        Returns:
+            tuple: The request and its FallbackStorage, whose queued messages tests can inspect
+        """
+        request = self.factory.post(path, data or {})
+        request.user = user if user is not None else self.user
+        request.session = {}
+        storage = FallbackStorage(request)
+        request._messages = storage
+
+        return request, storage
+
 
 class TestModel(models.Model):
     name = models.CharField(max_length=100, verbose_name="Name", help_text="Test model name")
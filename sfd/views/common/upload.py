@@ -1,22 +1,27 @@
 import csv
+import io
 import logging
 import os
 import shutil
 import uuid
 import zipfile
 from collections.abc import Sequence
+from contextlib import ExitStack
 from datetime import date, datetime, time, timedelta
+from decimal import Decimal
 from typing import Any
 
 from django import forms
 from django.conf import settings
-from django.db import models
+from django.core.files.uploadhandler import TemporaryFileUploadHandler
+from django.db import DEFAULT_DB_ALIAS, connections, models, router, transaction
 from django.db.models import TextChoices
 from django.http import HttpResponse
 from django.shortcuts import render
 from django.urls import path, reverse
 from django.utils import timezone
 from django.utils.translation import gettext_lazy as _
+from django.views.decorators.csrf import csrf_exempt
 
 from sfd.common.encrypted import EncryptedMixin
 from sfd.models.base import BaseModel, MasterModel, default_valid_from_date, default_valid_to_date
@@ -42,6 +47,159 @@ class UploadForm(forms.Form):
     encoding = forms.ChoiceField(choices=Encoding.choices, label=_("Encoding"))
 
 
+# Values in exactly the shapes downloads produce are parsed by the C fromisoformat parsers, which
+# give the same result as the matching strptime format below. Anything else goes through strptime
+# only, because fromisoformat also accepts shapes uploads must reject (e.g. "20240101", "1030").
+_strptime = datetime.strptime
+_DATE_FORMATS = ("%Y-%m-%d", "%Y-%m")
+_DATETIME_FORMATS = (
+    "%Y-%m-%d %H:%M:%S",
+    "%Y-%m-%d %H:%M",
+    "%Y-%m-%d %H:%M:%S.%f",
+    "%Y-%m-%d %H:%M:%S%z",
+    "%Y-%m-%d %H:%M:%S.%f%z",
+    "%Y-%m-%d",
+)
+_TIME_FORMATS = ("%H:%M:%S", "%H:%M")
+
+
+def _keep_value(key, value):
+    return value
+
+
+def _is_download_datetime(value):
+    """Return whether value is a naive "YYYY-MM-DD[ HH:MM[:SS[.ffffff]]]" string."""
+    if len(value) not in (10, 16, 19, 26) or value[4] != "-" or value[7] != "-":
+        return False
+    if not (value[:4] + value[5:7] + value[8:10]).isdigit():
+        return False
+    if len(value) == 10:
+        return True
+    if value[10] != " " or value[13] != ":" or not (value[11:13] + value[14:16]).isdigit():
+        return False
+    if len(value) == 16:
+        return True
+    if value[16] != ":" or not value[17:19].isdigit():
+        return False
+    # Anything after the seconds must be a 6-digit fraction, so offsets and "Z" take the strptime path
+    return len(value) == 19 or (value[19] == "." and value[20:26].isdigit())
+
+
+def _to_date(key, value):
+    if not value:
+        return None
+    if isinstance(value, str):
+        value = value.replace("/", "-")
+        if len(value) == 10 and value[4] == "-" and value[7] == "-":
+            try:
+                return date.fromisoformat(value)
+            except ValueError:
+                pass
+        for fmt in _DATE_FORMATS:
+            try:
+                return _strptime(value, fmt).date()
+            except ValueError:
+                continue
+        raise ValueError(f"Invalid value for {key}: {value}, it should be a datetime.")
+    if isinstance(value, date):
+        return value
+    raise ValueError(f"Invalid value for {key}: {value}, it should be a date.")
+
+
+def _to_datetime(key, value):
+    if not value:
+        return None
+    if isinstance(value, str):
+        value = value.replace("/", "-")
+        if _is_download_datetime(value):
+            try:
+                return datetime.fromisoformat(value)
+            except ValueError:
+                pass
+        for fmt in _DATETIME_FORMATS:
+            try:
+                return _strptime(value, fmt)
+            except ValueError:
+                continue
+        raise ValueError(f"Invalid value for {key}: {value}, it should be a datetime.")
+    if isinstance(value, datetime):
+        return value
+    raise ValueError(f"Invalid value for {key}: {value}, it should be a datetime.")
+
+
+def _to_time(key, value):
+    if not value:
+        return None
+    if isinstance(value, str):
+        if len(value) in (5, 8) and value[2] == ":" and value[5:6] in ("", ":"):
+            try:
+                return time.fromisoformat(value)
+            except ValueError:
+                pass
+        for fmt in _TIME_FORMATS:
+            try:
+                return _strptime(value.replace("/", "-"), fmt).time()
+            except ValueError:
+                continue
+        raise ValueError(f"Invalid value for {key}: {value}, it should be a time.")
+    if isinstance(value, time):
+        return value
+    raise ValueError(f"Invalid value for {key}: {value}, it should be a time.")
+
+
+def _to_duration(key, value):
+    if not value:
+        return None
+    if isinstance(value, str):
+        hour, minute, second = map(int, value.split(":"))
+        return timedelta(hours=hour, minutes=minute, seconds=second)
+    if isinstance(value, timedelta):
+        return value
+    raise ValueError(f"Invalid value for {key}: {value}, it should be a duration.")
+
+
+def _to_bool(key, value):
+    if value is None:
+        return None
+    if isinstance(value, str):
+        return value.lower() not in ("false", "0", "no", "")
+    if isinstance(value, int):
+        return value != 0
+    return bool(value)
+
+
+# Read buffer for CSV files opened from disk (spooled uploads and ZIP members); larger reads mean fewer syscalls.
+# Not mmap: the csv module parses decoded text, so every page is copied by the decoder either way.
+_CSV_READ_BUFFER_SIZE = 1 << 20
+
+
+def _to_copy_value(value):
+    """Render a DB-prepared value as a field of COPY's CSV format.
+
+    Each supported type is written in a form PostgreSQL parses back unchanged; anything else
+    raises TypeError so the batch falls back to bulk_create.
+    """
+    if value is None or isinstance(value, str):
+        return value
+    if isinstance(value, bool):
+        return "t" if value else "f"
+    if isinstance(value, date | time):  # datetime is a date subclass
+        return value.isoformat()
+    if isinstance(value, int | float | Decimal | uuid.UUID):
+        return str(value)
+    raise TypeError(f"{type(value).__name__} values are not written with COPY")
+
+
+# Converters for CSV cell values, by model field internal type; other fields are passed through unchanged
+_FIELD_CONVERTERS = {
+    "DateField": _to_date,
+    "DateTimeField": _to_datetime,
+    "TimeField": _to_time,
+    "DurationField": _to_duration,
+    "BooleanField": _to_bool,
+}
+
+
 class UploadMixin:
     """
     Mixin to handle file uploads in views.
@@ -55,11 +213,14 @@ class UploadMixin:
     is_skip_existing = True  # Whether to skip existing records during upload
     upload_column_names = ()  # Columns to be read from the CSV file
     upload_model = None  # Model to be used for uploading
-    chunk_size = 10000  # Process 1000 records at a time
+    chunk_size = None  # Rows per bulk flush; None uses settings.SFD_BULK_CREATE_BATCH_SIZE
 
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
 
+        if self.chunk_size is None:
+            self.chunk_size = getattr(settings, "SFD_BULK_CREATE_BATCH_SIZE", 10000)
+
         opts = self.model._meta  # type: ignore[attr-defined]
         self.upload_url_name = f"{opts.app_label}_{opts.model_name}_upload_file"  # type: ignore[attr-defined]
 
@@ -94,7 +255,7 @@ class UploadMixin:
         upload_column_names = self.get_upload_column_names(request)
         upload_model = self.upload_model if self.upload_model is not None else self.model  # type: ignore[attr-defined]
 
-        model_field_names = [f.name for f in upload_model._meta.get_fields() if f.concrete and not f.auto_created]  # type: ignore
+        model_field_names = {f.name for f in upload_model._meta.get_fields() if f.concrete and not f.auto_created}  # type: ignore
         db_fields = {name: upload_model._meta.get_field(name) for name in upload_column_names if name in model_field_names}
 
         logger.debug(f"Upload DB Fields: {list(db_fields.keys())}")
@@ -120,12 +281,22 @@ class UploadMixin:
         Note:
             Custom URLs are placed before default URLs to ensure they take
             precedence in URL resolution.
+            Uploaded files are spooled straight to a temporary file on disk, so
+            large CSV/ZIP uploads are never held in memory.
         """
         urls = super().get_urls()  # type: ignore
+        admin_upload_view = self.admin_site.admin_view(self.upload_file)  # type: ignore
+
+        # The CSRF check still runs inside admin_view; it must not read request.POST before the handlers are replaced
+        @csrf_exempt
+        def upload_view(request, *args, **kwargs):
+            request.upload_handlers = [TemporaryFileUploadHandler(request)]
+            return admin_upload_view(request, *args, **kwargs)
+
         upload_url = [
             path(
                 "upload_file/",
-                self.admin_site.admin_view(self.upload_file),  # type: ignore
+                upload_view,
                 name=self.upload_url_name,
             ),
         ]
@@ -170,7 +341,7 @@ class UploadMixin:
 
                 self._bulk_create_list = []
                 self._bulk_update_list = []
-                self._uploaded_unique_values = set()  # 今回アップロードしたCSVのユニーク値
+                self._uploaded_unique_values: set[tuple] = set()  # 今回アップロードしたCSVのユニーク値
                 self._total_inserted = 0  # Track total inserted across chunks
                 self._total_updated = 0  # Track total updated across chunks
                 self._upload_datetime = timezone.now()
@@ -183,36 +354,31 @@ class UploadMixin:
                     model_name = self.model._meta.verbose_name  # type: ignore[attr-defined]
 
                 try:
-                    self.pre_upload(request, cleaned_data)
-
-                    if upload_type == UploadType.EXCEL:
-                        self.excel_upload(file, request, cleaned_data)
-                    elif upload_type == UploadType.ZIP:
-                        csv_files = self.zip_upload(file, request, cleaned_data)
-                        for csv_file in csv_files:
-                            logger.info(f"Processing CSV file: {csv_file}")
-                            self.upload_data(self.get_csv_reader, csv_file, encoding, request, cleaned_data)
-                    else:
-                        self.upload_data(self.get_csv_reader, file, encoding, request, cleaned_data)
-
-                    self.post_upload(request=request, cleaned_data=cleaned_data)
-
-                    upload_message = _("Upload completed. Inserted: %(inserted)s rows, Updated: %(updated)s rows.") % {
-                        "inserted": self._total_inserted,
-                        "updated": self._total_updated,
-                    }
-                    # Create CSV log record for successful upload
-                    CsvLog.objects.create(
-                        process_id=self._process_id,
-                        process_type=CsvProcessType.UPLOAD,
-                        process_result=CsvProcessResult.SUCCESS if self._total_lines > 0 else CsvProcessResult.NO_DATA,
-                        app_name=self.get_app_name(),  # type: ignore
-                        processed_by=request.user.username,
-                        ip_address=self.get_client_ip(request),  # type: ignore
-                        file_name=file.name,
-                        total_line=self._total_lines,
-                        comment=f"{model_name}: {upload_message}",
-                    )
+                    # Commit every chunk of the upload, post_upload's writes and the success log at once; failures are logged after the rollback
+                    with ExitStack() as atomic_blocks:
+                        for db_alias in self._get_upload_transaction_aliases():
+                            atomic_blocks.enter_context(transaction.atomic(using=db_alias))
+                        self.pre_upload(request, cleaned_data)
+
+                        if upload_type == UploadType.EXCEL:
+                            self.excel_upload(file, request, cleaned_data)
+                        elif upload_type == UploadType.ZIP:
+                            csv_files = self.zip_upload(file, request, cleaned_data)
+                            for csv_file in csv_files:
+                                logger.info(f"Processing CSV file: {csv_file}")
+                                self.upload_data(self.get_csv_reader, csv_file, encoding, request, cleaned_data)
+                        else:
+                            self.upload_data(self.get_csv_reader, file, encoding, request, cleaned_data)
+
+                        self.post_upload(request=request, cleaned_data=cleaned_data)
+
+                        upload_message = _("Upload completed. Inserted: %(inserted)s rows, Updated: %(updated)s rows.") % {
+                            "inserted": self._total_inserted,
+                            "updated": self._total_updated,
+                        }
+                        # Create CSV log record for successful upload
+                        process_result = CsvProcessResult.SUCCESS if self._total_lines > 0 else CsvProcessResult.NO_DATA
+                        self._create_csv_log(request, file.name, process_result, f"{model_name}: {upload_message}")
 
                     logger.info(upload_message)
 
@@ -246,17 +412,7 @@ class UploadMixin:
                     }
 
                     # Create CSV log record for failed upload
-                    CsvLog.objects.create(
-                        process_id=self._process_id,
-                        process_type=CsvProcessType.UPLOAD,
-                        process_result=CsvProcessResult.FAILURE,
-                        app_name=self.get_app_name(),  # type: ignore
-                        processed_by=request.user.username,
-                        ip_address=self.get_client_ip(request),  # type: ignore
-                        file_name=file.name,
-                        total_line=self._total_lines,
-                        comment=f"{model_name}: {upload_message}",
-                    )
+                    self._create_csv_log(request, file.name, CsvProcessResult.FAILURE, f"{model_name}: {upload_message}")
 
                     self.message_user(request, upload_message, level="error")  # type: ignore
 
@@ -272,6 +428,33 @@ class UploadMixin:
             response = render(request, "sfd/upload.html", self.get_context_data())
             return response
 
+    def _get_upload_db_alias(self) -> str:
+        """Return the database alias the upload writes to."""
+        return router.db_for_write(self.upload_model if self.upload_model is not None else self.model)  # type: ignore[attr-defined]
+
+    def _get_upload_transaction_aliases(self) -> list[str]:
+        """Return the database aliases an upload runs in a transaction on.
+
+        Besides the upload model's database this includes the default database, which
+        post_upload hooks write to (e.g. auth groups and permissions), so their changes
+        roll back with the uploaded rows.
+        """
+        return list(dict.fromkeys([self._get_upload_db_alias(), DEFAULT_DB_ALIAS]))
+
+    def _create_csv_log(self, request, file_name, process_result, comment) -> CsvLog:
+        """Record the outcome of the current upload in CsvLog."""
+        return CsvLog.objects.create(
+            process_id=self._process_id,
+            process_type=CsvProcessType.UPLOAD,
+            process_result=process_result,
+            app_name=self.get_app_name(),  # type: ignore
+            processed_by=request.user.username,
+            ip_address=self.get_client_ip(request),  # type: ignore
+            file_name=file_name,
+            total_line=self._total_lines,
+            comment=comment,
+        )
+
     def pre_upload(self, request, cleaned_data=None) -> None:
         """Handle pre-upload processing."""
         if self.upload_model is not None:
@@ -306,13 +489,12 @@ class UploadMixin:
         os.makedirs(subdirectory, exist_ok=True)
         csv_files = []
         with zipfile.ZipFile(zip_file, "r") as zf:
-            zf.extractall(subdirectory)
-
-            # Find only CSV files
-            for root, _list, files in os.walk(subdirectory):
-                for f in files:
-                    if f.lower().endswith(".csv"):
-                        csv_files.append(os.path.join(root, f))
+            # Extract only CSV members, skipping directories and macOS resource forks up front.
+            # ZipFile.extract streams each member to disk in fixed-size blocks and sanitizes its path.
+            for info in zf.infolist():
+                if info.is_dir() or not info.filename.lower().endswith(".csv") or info.filename.startswith("__MACOSX/"):
+                    continue
+                csv_files.append(zf.extract(info, subdirectory))
 
         if not csv_files:
             raise ValueError(_("No CSV files found in the ZIP archive."))
@@ -330,23 +512,50 @@ class UploadMixin:
         Yields:
             dict: Each row of the CSV file as a dictionary
         """
-        # Handle both file objects and file paths
+        upload_field_names = self.get_upload_column_names(request)
+        if hasattr(csv_file, "temporary_file_path"):
+            # Uploads spooled to disk are read from their temporary file
+            csv_file = csv_file.temporary_file_path()
+
+        # Handle both file objects and file paths. Either way the file is decoded and parsed as a
+        # stream, so the whole file is never held in memory as one string plus a list of lines.
         if isinstance(csv_file, str):
             # csv_file is a file path (from ZIP extraction)
-            with open(csv_file, encoding=encoding) as f:
-                csv_content = f.read().splitlines()
+            with open(csv_file, encoding=encoding, newline="", buffering=_CSV_READ_BUFFER_SIZE) as f:
+                yield from self._read_csv_rows(f, upload_field_names)
         else:
             # csv_file is a file object (from direct upload)
-            csv_content = csv_file.read().decode(encoding).splitlines()
-
-        # Convert dict_keys to list for csv.DictReader compatibility
-        upload_field_names = self.get_upload_column_names(request)
-        reader = csv.DictReader(csv_content, fieldnames=upload_field_names, delimiter=self.delimiter)  # type: ignore
-        # Skip the header row
+            text_file = io.TextIOWrapper(csv_file, encoding=encoding, newline="")
+            try:
+                yield from self._read_csv_rows(text_file, upload_field_names)
+            finally:
+                # Leave the uploaded file open; its name is still needed for the CSV log
+                text_file.detach()
+
+    def _read_csv_rows(self, lines, upload_field_names) -> Any:
+        """Yield each row of an opened CSV text stream as a dictionary, skipping the header lines.
+
+        Rows are built like ``csv.DictReader`` builds them (blank lines skipped, missing columns
+        set to None, extra values under the None key) without its per-row method overhead.
+        """
+        reader = csv.reader(lines, delimiter=self.delimiter)  # type: ignore
+        field_names = tuple(upload_field_names)
+        width = len(field_names)
+        # Skip the header rows; like DictReader, blank lines before them do not count
         for _x in range(self.csv_skip_lines):
-            next(reader, None)
+            for row in reader:
+                if row:
+                    break
 
-        yield from reader
+        for row in reader:
+            if not row:
+                continue
+            row_dict = dict(zip(field_names, row, strict=False))
+            if len(row) < width:
+                row_dict.update(dict.fromkeys(field_names[len(row) :]))
+            elif len(row) > width:
+                row_dict[None] = row[width:]
+            yield row_dict
 
     def upload_data(self, upload_func, csv_file, encoding, request, cleaned_data=None) -> None:
         """Simple implementation of CSV upload. Only inserts new rows."""
@@ -355,8 +564,9 @@ class UploadMixin:
         if not hasattr(self, "_total_lines"):
             self._total_lines = 0
 
-        upload_fields = self.get_upload_db_fields(request, cleaned_data)
+        upload_fields = self._get_upload_fields(request, cleaned_data)
         unique_fields = self.get_model_unique_field_names()
+        unique_db_fields = [self.model._meta.get_field(name) for name in unique_fields]  # type: ignore[attr-defined]
         username = request.user.username  # type: ignore
         if issubclass(self.model, BaseModel):  # type: ignore
             creator_info = {"created_by": username, "created_at": self._upload_datetime}
@@ -369,12 +579,13 @@ class UploadMixin:
 
         # Process data in chunks to avoid memory issues with large files
         processed_count = 0
+        pending_rows = []  # (unique key, row_dict) pairs awaiting the per-chunk existing record lookup
 
         for row in reader:
             if not row:
                 continue
-            logger.debug(f"Processing row: {row}")
-            self._total_lines += 1  # Track total lines processed
+            logger.debug("Processing row: %s", row)  # Lazy formatting: the row is not rendered unless DEBUG logging is on
+            self._total_lines += 1  # Counted in this single pass; CsvLog.total_line never re-reads the file
             row_dict = self.convert2upload_fields(row, upload_fields, request, cleaned_data)
             if not row_dict:
                 raise ValueError(_("No valid data found in the row."))
@@ -385,52 +596,176 @@ class UploadMixin:
                 instance = self.model(**(creator_info | row_dict | updater_info))  # type: ignore
                 self._bulk_create_list.append(instance)
             else:
-                unique_values = {field: row_dict[field] for field in unique_fields if field in row_dict}
-                # Check if any unique_fields keys are not in unique_values
-                missing_unique_fields = [k for k in unique_fields if k not in unique_values.keys()]
-                if missing_unique_fields:
-                    raise ValueError(f"Row {row} is missing required unique fields: {missing_unique_fields}")
-
-                instance = self.model.objects.filter(**unique_values).first()  # type: ignore
-                if instance:  # DBに既存のレコードがあるか確認
-                    if not self.is_skip_existing:
-                        changed_values = {k: v for k, v in row_dict.items() if v != getattr(instance, k)}
-                        if changed_values:  # 変更がある場合のみ更新
-                            changed_values.update(updater_info)
-                            for k, v in changed_values.items():
-                                setattr(instance, k, v)
-                            self._bulk_update_list.append(instance)
-                else:
-                    if tuple(v for v in unique_values.values()) not in self._uploaded_unique_values:
-                        # 既にアップロード済みのレコードと重複してない場合
-                        instance = self.model(**(creator_info | row_dict | updater_info))  # type: ignore
-                        self._bulk_create_list.append(instance)
-
-                self._uploaded_unique_values.add(tuple(v for v in unique_values.values()))
+                # Reading the unique values is the presence check; the missing fields are only listed on failure
+                try:
+                    unique_values = [row_dict[field] for field in unique_fields]
+                except KeyError:
+                    missing_unique_fields = [k for k in unique_fields if k not in row_dict]
+                    raise ValueError(f"Row {row} is missing required unique fields: {missing_unique_fields}") from None
+
+                unique_key = self._normalize_unique_key(unique_values, unique_db_fields)
+                if not self.is_skip_existing:
+                    # Matched against existing records once per chunk in _queue_pending_rows, not queried per row
+                    pending_rows.append((unique_key, row_dict))
+                elif unique_key not in self._uploaded_unique_values:
+                    # 既にアップロード済みのレコードと重複してない場合
+                    # Rows already in the DB are dropped once per chunk in _queue_pending_rows, before any instance is built
+                    self._uploaded_unique_values.add(unique_key)
+                    pending_rows.append((unique_key, row_dict))
 
             processed_count += 1
 
             # Process in chunks to avoid memory issues
             if processed_count % self.chunk_size == 0:
-                self._process_bulk_operations(upload_fields)
+                self._queue_pending_rows(pending_rows, unique_db_fields, creator_info, updater_info)
+                self._flush_bulk_operations(upload_fields)
                 logger.debug(f"Processed {processed_count} records so far...")
 
         # Process any remaining records
+        self._queue_pending_rows(pending_rows, unique_db_fields, creator_info, updater_info)
+        self._flush_bulk_operations(upload_fields)
+
+    def _get_upload_fields(self, request, cleaned_data=None) -> dict[str, models.Field]:
+        """Return get_upload_db_fields, computed once per upload_file run (e.g. shared by every CSV in a ZIP)."""
+        process_id = getattr(self, "_process_id", None)
+        cached = getattr(self, "_upload_fields_cache", None)
+        if process_id is not None and cached is not None and cached[0] == process_id:
+            return cached[1]
+
+        upload_fields = self.get_upload_db_fields(request, cleaned_data)
+        self._upload_fields_cache = (process_id, upload_fields)
+        return upload_fields
+
+    def _get_unique_key(self, instance, unique_db_fields) -> tuple:
+        """Return the unique field values of an instance, normalized to the types read back from the DB."""
+        return self._normalize_unique_key((getattr(instance, field.attname) for field in unique_db_fields), unique_db_fields)
+
+    def _normalize_unique_key(self, values, unique_db_fields) -> tuple:
+        """Convert raw unique field values (e.g. CSV strings) with each field's to_python so they compare equal to DB values.
+
+        Encrypted fields are read back decrypted and their to_python would try to decrypt the plain value,
+        so their values are kept as-is.
+        """
+        return tuple(
+            value if isinstance(field, EncryptedMixin) else field.to_python(value.pk if isinstance(value, models.Model) else value)
+            for field, value in zip(unique_db_fields, values, strict=True)
+        )
+
+    def _get_existing_querysets(self, unique_keys, unique_db_fields) -> list[models.QuerySet]:
+        """Return querysets selecting the DB records that match the given unique keys.
+
+        A single unique field is matched with ``IN``; composite keys are matched with an OR of
+        per-key conditions on all fields. Keys are batched so no query exceeds the backend's
+        parameter limit.
+        """
+        connection = connections[router.db_for_read(self.model)]  # type: ignore[attr-defined]
+        attnames = [field.attname for field in unique_db_fields]
+
+        conditions = []
+        if len(attnames) == 1:
+            values = {key[0] for key in unique_keys}
+            if None in values:
+                values.discard(None)
+                conditions.append(models.Q(**{f"{attnames[0]}__isnull": True}))
+            values_per_query = connection.features.max_query_params or len(values) or 1
+            values = list(values)
+            conditions += [models.Q(**{f"{attnames[0]}__in": values[i : i + values_per_query]}) for i in range(0, len(values), values_per_query)]
+            return [self.model.objects.filter(condition) for condition in conditions]  # type: ignore[attr-defined]
+
+        keys = list(unique_keys)
+        keys_per_query = (connection.features.max_query_params or 0) // len(attnames) or len(keys) or 1
+        for i in range(0, len(keys), keys_per_query):
+            condition = models.Q()
+            for key in keys[i : i + keys_per_query]:
+                lookup = {}
+                for attname, value in zip(attnames, key, strict=True):
+                    if value is None:
+                        lookup[f"{attname}__isnull"] = True
+                    else:
+                        lookup[attname] = value
+                condition |= models.Q(**lookup)
+            conditions.append(condition)
+        return [self.model.objects.filter(condition) for condition in conditions]  # type: ignore[attr-defined]
+
+    def _get_existing_unique_keys(self, unique_keys, unique_db_fields) -> set[tuple]:
+        """Return which of the given unique keys already exist in the DB."""
+        attnames = [field.attname for field in unique_db_fields]
+        existing_keys = set()
+        for queryset in self._get_existing_querysets(unique_keys, unique_db_fields):
+            for row in queryset.values_list(*attnames):
+                key = self._normalize_unique_key(row, unique_db_fields)
+                if key in unique_keys:
+                    existing_keys.add(key)
+        return existing_keys
+
+    def _get_existing_records(self, unique_keys, unique_db_fields) -> dict[tuple, models.Model]:
+        """Return the existing DB records for the given unique keys, keyed by unique key."""
+        existing_records = {}
+        for queryset in self._get_existing_querysets(unique_keys, unique_db_fields):
+            for instance in queryset:
+                key = self._get_unique_key(instance, unique_db_fields)
+                if key in unique_keys:
+                    existing_records[key] = instance
+        return existing_records
+
+    def _queue_pending_rows(self, pending_rows, unique_db_fields, creator_info, updater_info) -> None:
+        """Sort buffered rows into bulk updates of existing records and bulk creates of new ones.
+
+        Existing records are fetched for the whole chunk at once. Repeated rows for an existing
+        record are applied in order; only the first row of a new unique key is inserted. When
+        skipping existing records, rows already in the DB are dropped and model instances are
+        built only for the remaining new rows.
+        """
+        if not pending_rows:
+            return
+
+        if self.is_skip_existing:
+            existing_keys = self._get_existing_unique_keys({key for key, _row in pending_rows}, unique_db_fields)
+            self._bulk_create_list.extend(
+                [self.model(**(creator_info | row_dict | updater_info)) for key, row_dict in pending_rows if key not in existing_keys]  # type: ignore
+            )
+            pending_rows.clear()
+            return
+
+        existing_records = self._get_existing_records({key for key, _row in pending_rows}, unique_db_fields)
+        updated_keys = set()
+        for unique_key, row_dict in pending_rows:
+            instance = existing_records.get(unique_key)
+            if instance:  # DBに既存のレコードがあるか確認
+                changed_values = {k: v for k, v in row_dict.items() if v != getattr(instance, k)}
+                if changed_values:  # 変更がある場合のみ更新
+                    changed_values.update(updater_info)
+                    for k, v in changed_values.items():
+                        setattr(instance, k, v)
+                    if unique_key not in updated_keys:
+                        updated_keys.add(unique_key)
+                        self._bulk_update_list.append(instance)
+            elif unique_key not in self._uploaded_unique_values:
+                # 既にアップロード済みのレコードと重複してない場合
+                self._bulk_create_list.append(self.model(**(creator_info | row_dict | updater_info)))  # type: ignore
+
+            self._uploaded_unique_values.add(unique_key)
+        pending_rows.clear()
+
+    def _flush_bulk_operations(self, upload_fields) -> None:
+        """Write the buffered chunk, if any."""
         if self._bulk_create_list or self._bulk_update_list:
             self._process_bulk_operations(upload_fields)
 
     def _process_bulk_operations(self, upload_fields) -> None:
         """Process bulk create and update operations in chunks."""
-        from django.db import transaction
+        db_alias = self._get_upload_db_alias()
 
-        # Use atomic transaction for each chunk to ensure proper commit
-        with transaction.atomic():
+        # Runs inside upload_file's transaction, so no savepoint is needed per chunk
+        with transaction.atomic(using=db_alias, savepoint=False):
             if self._bulk_create_list:
-                create_count = len(self._bulk_create_list)
-                if self.upload_model is not None:
-                    self.upload_model.objects.bulk_create(self._bulk_create_list)
-                else:
-                    self.model.objects.bulk_create(self._bulk_create_list)  # type: ignore
+                create_model = self.upload_model if self.upload_model is not None else self.model  # type: ignore[attr-defined]
+                # Existing records were already filtered out per chunk, so every row is inserted or the upload fails;
+                # conflicts are not ignored, which would hide other constraint violations and overcount the inserted rows
+                create_count = self._copy_bulk_create(create_model, self._bulk_create_list, db_alias)
+                if create_count is None:
+                    create_model.objects.bulk_create(self._bulk_create_list, batch_size=self.chunk_size)
+                    create_count = len(self._bulk_create_list)
                 self._total_inserted += create_count
                 self._bulk_create_list.clear()  # Clear the list to free memory
 
@@ -438,12 +773,48 @@ class UploadMixin:
                 update_count = len(self._bulk_update_list)
                 upload_field_names = list(upload_fields.keys())
                 if self.upload_model is not None:
-                    self.upload_model.objects.bulk_update(self._bulk_update_list, upload_field_names)
+                    self.upload_model.objects.bulk_update(self._bulk_update_list, upload_field_names, batch_size=self.chunk_size)
                 else:
-                    self.model.objects.bulk_update(self._bulk_update_list, upload_field_names)  # type: ignore
+                    self.model.objects.bulk_update(self._bulk_update_list, upload_field_names, batch_size=self.chunk_size)  # type: ignore
                 self._total_updated += update_count
                 self._bulk_update_list.clear()  # Clear the list to free memory
 
+    def _copy_bulk_create(self, model, instances, db_alias) -> int | None:
+        """Insert instances with PostgreSQL ``COPY ... FROM STDIN`` and return the inserted row count.
+
+        Opt-in: used only when ``settings.SFD_UPLOAD_COPY_THRESHOLD`` is set and the batch is larger
+        than it on PostgreSQL; returns None when the batch has to go through bulk_create instead. Like bulk_create, no signals are
+        sent, primary keys are not set on the instances, and a constraint violation fails the batch.
+        """
+        threshold = getattr(settings, "SFD_UPLOAD_COPY_THRESHOLD", None)
+        connection = connections[db_alias]
+        if not threshold or connection.vendor != "postgresql" or len(instances) <= threshold:
+            return None
+
+        opts = model._meta
+        if any(instance.pk is not None for instance in instances):
+            return None
+        fields = [field for field in opts.concrete_fields if not field.generated and not isinstance(field, models.AutoField)]
+
+        # QUOTE_NOTNULL leaves only None unquoted, which COPY's CSV format reads as NULL ("" stays an empty string)
+        buffer = io.StringIO()
+        writer = csv.writer(buffer, quoting=csv.QUOTE_NOTNULL)
+        try:
+            for instance in instances:
+                writer.writerow([_to_copy_value(field.get_db_prep_save(field.pre_save(instance, True), connection)) for field in fields])
+        except TypeError:
+            return None
+        buffer.seek(0)
+
+        quote_name = connection.ops.quote_name
+        table = quote_name(opts.db_table)
+        columns = ", ".join(quote_name(field.column) for field in fields)
+        with connection.cursor() as cursor:
+            if not hasattr(cursor, "copy_expert"):
+                return None
+            cursor.copy_expert(f"COPY {table} ({columns}) FROM STDIN WITH (FORMAT csv)", buffer)
+        return len(instances)
+
     def convert2upload_fields(self, row_dict, upload_fields, request, cleaned_data=None) -> dict[str, Any]:
         """Convert CSV row_dict data to model field type
         外部キーIDはDBシーケンスになるので、Table再作成によって異なる可能性があるため、ダウン・アップロードに使用しない。
@@ -452,97 +823,30 @@ class UploadMixin:
         For encrypted fields, we pass the raw value as-is, and let the field's get_prep_value()
         method handle the encryption during the save operation.
         """
-        converted = {}
-        for key, value in row_dict.items():
-            if key not in upload_fields.keys():
-                continue
+        converters = self._get_row_converters(upload_fields)
+        return {key: converters[key](key, value) for key, value in row_dict.items() if key in converters}
 
-            # Check if field is encrypted first - if so, pass raw value as-is
-            if isinstance(upload_fields[key], EncryptedMixin):
-                # For encrypted fields, just pass the raw value
-                # The field's get_prep_value method will encrypt it during save
-                converted[key] = value
-                continue
+    def _get_row_converters(self, upload_fields) -> dict[str, Any]:
+        """Return the converter for each upload field, built once per upload_fields mapping.
 
-            if upload_fields[key].get_internal_type() == "DateField":
-                if not value:
-                    converted[key] = None
-                elif isinstance(value, str):
-                    value = value.replace("/", "-")
-                    for fmt in ("%Y-%m-%d", "%Y-%m"):
-                        try:
-                            converted[key] = datetime.strptime(value, fmt).date()
-                            break
-                        except ValueError:
-                            continue
-                    else:
-                        raise ValueError(f"Invalid value for {key}: {value}, it should be a datetime.")
-                elif isinstance(value, date):
-                    converted[key] = value
-                else:
-                    raise ValueError(f"Invalid value for {key}: {value}, it should be a date.")
-            elif upload_fields[key].get_internal_type() == "DateTimeField":
-                if not value:
-                    converted[key] = None
-                elif isinstance(value, str):
-                    value = value.replace("/", "-")
-                    for fmt in (
-                        "%Y-%m-%d %H:%M:%S",
-                        "%Y-%m-%d %H:%M",
-                        "%Y-%m-%d %H:%M:%S.%f",
-                        "%Y-%m-%d %H:%M:%S%z",
-                        "%Y-%m-%d %H:%M:%S.%f%z",
-                        "%Y-%m-%d",
-                    ):
-                        try:
-                            converted[key] = datetime.strptime(value, fmt)
-                            break
-                        except ValueError:
-                            continue
-                    else:
-                        raise ValueError(f"Invalid value for {key}: {value}, it should be a datetime.")
-                elif isinstance(value, datetime):
-                    converted[key] = value
-                else:
-                    raise ValueError(f"Invalid value for {key}: {value}, it should be a datetime.")
-            elif upload_fields[key].get_internal_type() == "TimeField":
-                if not value:
-                    converted[key] = None
-                elif isinstance(value, str):
-                    for fmt in ("%H:%M:%S", "%H:%M"):
-                        try:
-                            converted[key] = datetime.strptime(value.replace("/", "-"), fmt).time()
-                            break
-                        except ValueError:
-                            continue
-                    else:
-                        raise ValueError(f"Invalid value for {key}: {value}, it should be a time.")
-                elif isinstance(value, time):
-                    converted[key] = value
-                else:
-                    raise ValueError(f"Invalid value for {key}: {value}, it should be a time.")
-            elif upload_fields[key].get_internal_type() == "DurationField":
-                if not value:
-                    converted[key] = None
-                elif isinstance(value, str):
-                    hour, minute, second = map(int, value.split(":"))
-                    converted[key] = timedelta(hours=hour, minutes=minute, seconds=second)
-                elif isinstance(value, timedelta):
-                    converted[key] = value
-                else:
-                    raise ValueError(f"Invalid value for {key}: {value}, it should be a duration.")
-            elif upload_fields[key].get_internal_type() == "BooleanField":
-                if value is None:
-                    converted[key] = None
-                elif isinstance(value, str):
-                    converted[key] = value.lower() not in ("false", "0", "no", "")
-                elif isinstance(value, int):
-                    converted[key] = value != 0
-                else:
-                    converted[key] = bool(value)
+        The field type dispatch runs here instead of for every cell. The cache is keyed by the
+        identity of ``upload_fields``, which upload_data builds once per upload and never mutates.
+        """
+        cached = getattr(self, "_row_converters", None)
+        if cached is not None and cached[0] is upload_fields:
+            return cached[1]
+
+        converters = {}
+        for key, field in upload_fields.items():
+            # For encrypted fields, pass the raw value as-is; the field's get_prep_value method encrypts it during save
+            if isinstance(field, EncryptedMixin):
+                converters[key] = _keep_value
             else:
-                converted[key] = value
-        return converted
+                converters[key] = _FIELD_CONVERTERS.get(field.get_internal_type(), _keep_value)
+
+        # Keep a reference to upload_fields so its id cannot be reused while cached
+        self._row_converters = (upload_fields, converters)
+        return converters
 
     def changelist_view(self, request, extra_context=None):
         if extra_context is None:
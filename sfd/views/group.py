@@ -65,10 +65,52 @@ class SfdGroupAdmin(UploadMixin, DownloadMixin, ModelAdminMixin, GroupAdmin):
         }
 
     def post_upload(self, request, cleaned_data=None) -> None:
-        for uploaded in GroupUpload.objects.all():
-            group, created = Group.objects.get_or_create(name=uploaded.name)
-            if uploaded.app_label and uploaded.model and uploaded.codename:
-                content_type = ContentType.objects.get(app_label=uploaded.app_label, model=uploaded.model)
-                permission = Permission.objects.get(codename=uploaded.codename, content_type=content_type)
-                if not group.permissions.filter(id=permission.id).exists():  # type: ignore
-                    group.permissions.add(permission)
+        uploads = list(GroupUpload.objects.values("name", "codename", "app_label", "model"))
+        permission_rows = [row for row in uploads if row["app_label"] and row["model"] and row["codename"]]
+
+        # Resolve content types and permissions with one query each instead of two queries per row
+        content_types = {}
+        permissions = {}
+        if permission_rows:
+            content_types = {
+                (content_type.app_label, content_type.model): content_type
+                for content_type in ContentType.objects.filter(
+                    app_label__in={row["app_label"] for row in permission_rows},
+                    model__in={row["model"] for row in permission_rows},
+                )
+            }
+            permissions = {
+                (permission.codename, permission.content_type_id): permission  # type: ignore
+                for permission in Permission.objects.filter(
+                    codename__in={row["codename"] for row in permission_rows},
+                    content_type__in=list(content_types.values()),
+                )
+            }
+
+        # Resolve groups by name in bulk, creating the missing ones with a single INSERT
+        names = {row["name"] for row in uploads}
+        groups = Group.objects.filter(name__in=names).in_bulk(field_name="name")
+        missing_names = names - groups.keys()
+        if missing_names:
+            Group.objects.bulk_create([Group(name=name) for name in missing_names], ignore_conflicts=True)
+            # ignore_conflicts leaves primary keys unset, so read the new groups back
+            groups.update(Group.objects.filter(name__in=missing_names).in_bulk(field_name="name"))
+
+        group_permissions = set()
+        for row in uploads:
+            group = groups[row["name"]]
+            if row["app_label"] and row["model"] and row["codename"]:
+                content_type = content_types.get((row["app_label"], row["model"]))
+                if content_type is None:
+                    raise ContentType.DoesNotExist(f"ContentType {row['app_label']}.{row['model']} does not exist.")
+                permission = permissions.get((row["codename"], content_type.id))  # type: ignore
+                if permission is None:
+                    raise Permission.DoesNotExist(f"Permission {row['codename']} does not exist for {row['app_label']}.{row['model']}.")
+                group_permissions.add((group.id, permission.id))  # type: ignore
+
+        # Link all permissions in one INSERT; pairs the group already has are skipped by the unique constraint
+        GroupPermission = Group.permissions.through
+        GroupPermission.objects.bulk_create(
+            [GroupPermission(group_id=group_id, permission_id=permission_id) for group_id, permission_id in group_permissions],
+            ignore_conflicts=True,
+        )
@@ -1,9 +1,12 @@
+import functools
 import io
 import logging
 import os
 from typing import Any
 
+from django.conf import settings
 from django.contrib import admin
+from django.db import transaction
 from django.db.models import QuerySet
 from django.utils.translation import gettext_lazy as _
 from reportlab.lib.pagesizes import mm  # type: ignore
@@ -18,6 +21,22 @@ from sfd.views.common.upload import Encoding
 logger = logging.getLogger(__name__)
 
 
+def _query_recent_years(model) -> list[tuple[Any, str]]:
+    years = model.objects.dates("date", "year").values_list("date__year", flat=True).distinct().order_by("-date__year")
+    return [(year, str(year)) for year in years[:10]]
+
+
+# Year choices memoized per model when SFD_CACHE_HOLIDAY_YEARS is enabled.
+# Cleared after commit on Holiday save/delete (see sfd.signals) and after a Holiday upload, which uses bulk writes
+# that send no signals.
+_cached_recent_years = functools.cache(_query_recent_years)
+
+
+def clear_recent_years_cache(using=None) -> None:
+    """Clear the memoized year choices once the current transaction on ``using`` commits."""
+    transaction.on_commit(_cached_recent_years.cache_clear, using=using)
+
+
 class FilterYear(admin.SimpleListFilter):
     """Filter for date field"""
 
@@ -25,8 +44,16 @@ class FilterYear(admin.SimpleListFilter):
     parameter_name = "year"
 
     def lookups(self, request, model_admin) -> list[tuple[Any, str]]:
-        years = model_admin.model.objects.dates("date", "year").values_list("date__year", flat=True).distinct().order_by("-date__year")
-        return [(year, str(year)) for year in years[:10]]
+        """Return the ten most recent years as choices.
+
+        When ``settings.SFD_CACHE_HOLIDAY_YEARS`` is True, the years are memoized per process instead
+        of queried on every changelist render. Enable it only for single-process deployments or where
+        holidays are changed through the admin: other processes, and raw ``update()`` calls, do not
+        clear the cache.
+        """
+        if getattr(settings, "SFD_CACHE_HOLIDAY_YEARS", False):
+            return list(_cached_recent_years(model_admin.model))
+        return _query_recent_years(model_admin.model)
 
     def queryset(self, request, queryset) -> QuerySet[Any] | None:
         if self.value():
@@ -45,6 +72,10 @@ class HolidayAdmin(BasePdfMixin, BaseModelAdmin):
     def get_search_field_names(self) -> str:
         return _("year, name")
 
+    def post_upload(self, request, cleaned_data=None) -> None:
+        super().post_upload(request, cleaned_data)
+        clear_recent_years_cache(self._get_upload_db_alias())
+
     def create_pdf_files(self, request, queryset) -> list[str]:
         buffer = io.BytesIO()
         doc = BaseDocTemplate(
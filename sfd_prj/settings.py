@@ -78,6 +78,16 @@ TEMPLATES = [
     },
 ]
 
+# Memoize get_attr template filter lookups per object (only safe when rendered objects are not mutated)
+SFD_CACHE_TEMPLATETAG_ATTRS = config("SFD_CACHE_TEMPLATETAG_ATTRS", default=False, cast=bool)
+# Memoize the holiday admin year filter choices per process (only safe when holidays change through this process)
+SFD_CACHE_HOLIDAY_YEARS = config("SFD_CACHE_HOLIDAY_YEARS", default=False, cast=bool)
+
+# Rows buffered by the CSV upload before each bulk_create/bulk_update flush (also used as their batch_size)
+SFD_BULK_CREATE_BATCH_SIZE = config("SFD_BULK_CREATE_BATCH_SIZE", default=10000, cast=int)
+# Opt-in: chunks with more rows than this are inserted with COPY ... FROM STDIN on PostgreSQL instead of bulk_create (0 disables)
+SFD_UPLOAD_COPY_THRESHOLD = config("SFD_UPLOAD_COPY_THRESHOLD", default=0, cast=int)
+
 WSGI_APPLICATION = "sfd_prj.wsgi.application"
 
 